@@ -1,3 +1,4 @@
+import contextlib
 import struct
 import time
 import serial # pyserial
@@ -25,6 +26,12 @@ CMD_CONVERT_CODE_TO_UPD_PICTOGRAPH_DATA = 0x43
 CMD_READ_KEYS = 0x44
 CMD_LOAD_KEYS = 0x45
 
+# single byte packet header for each command, built once so the high
+# level methods don't make a new list for it on every call
+_HEADERS = dict((value, bytes(bytearray([value])))
+                for name, value in list(globals().items())
+                if name.startswith('CMD_'))
+
 ERROR_OK = 0x00
 ERROR_NO_COMMAND = 0x01
 ERROR_BAD_COMMAND = 0x02
@@ -49,90 +56,104 @@ UPD_DIRTY_PICTOGRAPH = 1<<UPD_RAM_PICTOGRAPH
 UPD_DIRTY_CHARGEN = 1<<UPD_RAM_CHARGEN
 UPD_DIRTY_LED = 1<<UPD_RAM_LED
 
+# most bytes of packets queued by Client.pipeline() before they are sent.
+# the AVR's uart ring buffers are only 256 bytes and are not flow controlled.
+PIPELINE_MAX_QUEUED = 128
+
 
 class Client(object):
     def __init__(self, ser):
         self.serial = ser
+        self._queued = None # packets queued by pipeline(), or None
+        self._queued_count = 0
+        # every packet sent outside of a pipeline is built in this buffer.
+        # it is the largest possible packet (length byte + 255 bytes).
+        self._tx_buf = bytearray(256)
+        self._tx_view = memoryview(self._tx_buf)
 
     # High level ==============================================================
 
     def echo(self, data):
-        rx_bytes = self.command(bytearray([CMD_ECHO]) + bytearray(data))
+        rx_bytes = self.command(_HEADERS[CMD_ECHO], args=data)
         return rx_bytes[1:]
 
     def set_run_mode(self, mode):
-        self.command([CMD_SET_RUN_MODE, int(mode)])
+        self._command_ack(_HEADERS[CMD_SET_RUN_MODE], args=[int(mode)])
 
     def set_auto_display_passthru(self, enabled):
-        self.command([CMD_SET_AUTO_DISPLAY_PASSTHRU, int(enabled)])
+        self._command_ack(
+            _HEADERS[CMD_SET_AUTO_DISPLAY_PASSTHRU], args=[int(enabled)])
 
     def set_auto_key_passthru(self, enabled):
-        self.command([CMD_SET_AUTO_KEY_PASSTHRU, int(enabled)])
+        self._command_ack(
+            _HEADERS[CMD_SET_AUTO_KEY_PASSTHRU], args=[int(enabled)])
 
     def set_led(self, led_num, led_state):
-        self.command([CMD_SET_LED, led_num, int(led_state)])
+        self._command_ack(
+            _HEADERS[CMD_SET_LED], args=[led_num, int(led_state)])
 
     def emulated_upd_reset(self):
-        self.command([CMD_EMULATED_UPD_RESET])
+        self._command_ack(_HEADERS[CMD_EMULATED_UPD_RESET])
 
     def emulated_upd_dump_state(self):
-        data = self.command([CMD_EMULATED_UPD_DUMP_STATE])
+        data = self.command(_HEADERS[CMD_EMULATED_UPD_DUMP_STATE])
         return UpdEmulatorState(data[1:])
 
     def emulated_upd_send_command(self, spi_bytes):
-        data = bytearray([CMD_EMULATED_UPD_SEND_COMMAND]) + bytearray(spi_bytes)
-        self.command(data)
+        self._command_ack(
+            _HEADERS[CMD_EMULATED_UPD_SEND_COMMAND], args=spi_bytes)
 
     def emulated_upd_load_key_data(self, key_bytes):
-        data = bytearray([CMD_EMULATED_UPD_LOAD_KEY_DATA]) + bytearray(key_bytes)
-        self.command(data)
+        self._command_ack(
+            _HEADERS[CMD_EMULATED_UPD_LOAD_KEY_DATA], args=key_bytes)
 
     def faceplate_upd_send_command(self, spi_bytes):
-        data = bytearray([CMD_FACEPLATE_UPD_SEND_COMMAND]) + bytearray(spi_bytes)
-        self.command(data)
+        self._command_ack(
+            _HEADERS[CMD_FACEPLATE_UPD_SEND_COMMAND], args=spi_bytes)
 
     def faceplate_upd_dump_state(self):
-        data = self.command([CMD_FACEPLATE_UPD_DUMP_STATE])
+        data = self.command(_HEADERS[CMD_FACEPLATE_UPD_DUMP_STATE])
         return UpdEmulatorState(data[1:])
 
     def faceplate_upd_clear_display(self):
-        self.command([CMD_FACEPLATE_UPD_CLEAR_DISPLAY])
+        self._command_ack(_HEADERS[CMD_FACEPLATE_UPD_CLEAR_DISPLAY])
 
     def faceplate_upd_read_key_data(self):
-        data = self.command([CMD_FACEPLATE_UPD_READ_KEY_DATA])
+        data = self.command(_HEADERS[CMD_FACEPLATE_UPD_READ_KEY_DATA])
         return data[1:]
 
     def radio_state_reset(self):
-        self.command([CMD_RADIO_STATE_RESET])
+        self._command_ack(_HEADERS[CMD_RADIO_STATE_RESET])
 
     def radio_state_dump(self):
-        data = self.command([CMD_RADIO_STATE_DUMP])
+        data = self.command(_HEADERS[CMD_RADIO_STATE_DUMP])
         return RadioState(data[1:])
 
     def radio_state_parse(self, display):
-        data = bytearray([CMD_RADIO_STATE_PARSE]) + bytearray(display)
-        self.command(data)
+        self._command_ack(_HEADERS[CMD_RADIO_STATE_PARSE], args=display)
 
     def convert_upd_key_data_to_codes(self, key_data):
-        data = (bytearray([CMD_CONVERT_UPD_KEY_DATA_TO_CODES]) +
-                bytearray(key_data))
-        rx_bytes = self.command(data)
+        rx_bytes = self.command(
+            _HEADERS[CMD_CONVERT_UPD_KEY_DATA_TO_CODES], args=key_data)
         num_keys_pressed = rx_bytes[1]
         return list(rx_bytes[2:2+num_keys_pressed])
 
     def convert_code_to_upd_key_data(self, key_code):
-        rx_bytes = self.command([CMD_CONVERT_CODE_TO_UPD_KEY_DATA, key_code])
+        rx_bytes = self.command(
+            _HEADERS[CMD_CONVERT_CODE_TO_UPD_KEY_DATA], args=[key_code])
         return list(rx_bytes[1:])
 
     def convert_upd_pictograph_data_to_codes(self, pictograph_data):
-        data = (bytearray([CMD_CONVERT_UPD_PICTOGRAPH_DATA_TO_CODES]) +
-                bytearray(pictograph_data))
-        rx_bytes = self.command(data)
+        rx_bytes = self.command(
+            _HEADERS[CMD_CONVERT_UPD_PICTOGRAPH_DATA_TO_CODES],
+            args=pictograph_data)
         num_pictographs_displayed = rx_bytes[1]
         return list(rx_bytes[2:2+num_pictographs_displayed])
 
     def convert_code_to_upd_pictograph_data(self, pictograph_code):
-        rx_bytes = self.command([CMD_CONVERT_CODE_TO_UPD_PICTOGRAPH_DATA, pictograph_code])
+        rx_bytes = self.command(
+            _HEADERS[CMD_CONVERT_CODE_TO_UPD_PICTOGRAPH_DATA],
+            args=[pictograph_code])
         return list(rx_bytes[1:])
 
     def read_keys(self):
@@ -140,24 +161,24 @@ class Client(object):
         key codes (KEY_ constants).  If no keys are pressed, the list will
         be empty.  At most 2 keys can be pressed at once, so up to 2 key
         codes may be returned.'''
-        rx_bytes = self.command([CMD_READ_KEYS])
+        rx_bytes = self.command(_HEADERS[CMD_READ_KEYS])
         num_keys_pressed = rx_bytes[1]
         return list(rx_bytes[2:2+num_keys_pressed])
 
     def load_keys(self, key_codes):
         '''send key presses to the radio'''
         count = len(key_codes)
-        data = [CMD_LOAD_KEYS, count, 0, 0]
+        args = [count, 0, 0]
         if count > 0:
-            data[2] = key_codes[0]
+            args[1] = key_codes[0]
         if count > 1:
-            data[3] = key_codes[1]
+            args[2] = key_codes[1]
         if count > 2:
             raise ValueError(
                 'Tried to press %d keys, but only 0, 1, or 2 keys '
                 'can be pressed at once' % count
                 )
-        self.command(data)
+        self._command_ack(_HEADERS[CMD_LOAD_KEYS], args=args)
 
     def hit_key(self, key, secs=0.15):
         '''TODO implement this on the AVR side instead'''
@@ -181,69 +202,160 @@ class Client(object):
 
     # Low level ===============================================================
 
-    def command(self, data, ignore_error=False):
+    @contextlib.contextmanager
+    def pipeline(self):
+        '''Batch commands to save serial round trips.  Inside the block,
+        commands that only return an error byte are queued instead of
+        being sent.  The queue is sent in one write along with the next
+        command that returns data, or when the block exits, and the
+        replies to the queued commands are read back and checked then.
+        Every reply in a batch is read before the first NAK in it is
+        raised.  If the block raises, the queued commands are not sent.'''
+        if self._queued is not None: # already batching
+            yield self
+            return
+        self._queued = bytearray()
+        self._queued_count = 0
+        try:
+            yield self
+            self._check_nak(self._send_queued())
+        finally:
+            self._queued = None
+
+    def command(self, data, ignore_error=False, args=b''):
         self._flush_rx() # discard rx if a previous command was interrupted
-        self.send(data)
+        if self._queued is None:
+            self.send(data, args)
+        else:
+            # send this command in the same write as any queued ones
+            self._queue(data, args)
+            nak = self._send_queued(num_replies_kept=1)
+            rx_bytes = self.receive(ignore_error=True)
+            self._check_nak(nak)
+            self._check_nak(rx_bytes, ignore_error)
+            return rx_bytes
         return self.receive(ignore_error)
 
-    def send(self, data):
-        self.serial.write(bytearray([len(data)] + list(data)))
+    def _command_ack(self, data, args=b''):
+        '''Send a command whose reply is only an error byte, or queue
+        it if inside a pipeline()'''
+        if self._queued is None:
+            self.command(data, args=args)
+            return
+        self._queue(data, args)
+
+    def _queue(self, data, args=b''):
+        packet = _frame(data, args)
+        if len(self._queued) + len(packet) > PIPELINE_MAX_QUEUED:
+            self._check_nak(self._send_queued())
+        self._queued += packet
+        self._queued_count += 1
+
+    def _send_queued(self, num_replies_kept=0):
+        '''Write the queued packets at once and read their replies,
+        except for the last num_replies_kept that the caller will read.
+        All of the replies are read even after a NAK so the next command
+        doesn't get a stale one.  Returns the first NAK reply, or None.'''
+        if self._queued:
+            self._flush_rx()
+            self.serial.write(self._queued)
+            self._flush_tx()
+            del self._queued[:]
+        num_replies, self._queued_count = self._queued_count, 0
+        nak = None
+        for i in range(num_replies - num_replies_kept):
+            rx_bytes = self.receive(ignore_error=True)
+            if nak is None and rx_bytes[0] != ERROR_OK:
+                nak = rx_bytes
+        return nak
+
+    def send(self, data, args=b''):
+        '''Send a command packet.  The optional args are written after
+        data in the same packet so callers don't need to build a copy
+        of the command byte concatenated with its arguments.'''
+        length = _frame_into(self._tx_buf, data, args)
+        self.serial.write(self._tx_view[:length])
         self._flush_tx()
 
     def receive(self, ignore_error=False):
-        # read number of bytes to expect
-        head = self.serial.read(1)
+        # read number of bytes to expect.  it is read by itself because an
+        # invalid header of 0 has no error byte after it, and reading one
+        # more byte would take the header of the next reply.
+        head = bytearray(self.serial.read(1))
         if len(head) == 0:
             raise Exception("Timeout: No reply header byte received")
-        expected_num_bytes = ord(head)
-
-        # read bytes expected, or more if available
-        num_bytes_to_read = expected_num_bytes
-        if self.serial.in_waiting > num_bytes_to_read: # unexpected extra data
-            num_bytes_to_read = self.serial.in_waiting
-        rx_bytes = bytearray(self.serial.read(num_bytes_to_read))
+        expected_num_bytes = head[0]
+        if expected_num_bytes == 0:
+            raise Exception("Invalid: Reply had header byte but not ack/nak")
 
-        # sanity checks on reply length
+        # read the error byte and any data.  the read never returns more
+        # than was asked for; unexpected extra data is discarded by
+        # _flush_rx() before the next command is sent.
+        rx_bytes = bytearray(self.serial.read(expected_num_bytes))
         if len(rx_bytes) < expected_num_bytes:
             raise Exception(
                 "Timeout: Expected reply of %d bytes, got only %d bytes: %r" %
                 (expected_num_bytes, len(rx_bytes), rx_bytes)
                 )
-        elif len(rx_bytes) > expected_num_bytes:
-            raise Exception(
-                "Invalid: Too long: expected %d bytes, got %d bytes: %r " %
-                (expected_num_bytes, len(rx_bytes), rx_bytes)
-            )
-        elif len(rx_bytes) == 0:
-            raise Exception("Invalid: Reply had header byte but not ack/nak")
 
         # check error code byte
-        if (rx_bytes[0] != ERROR_OK) and (not ignore_error):
-            raise Exception("Received NAK response: %r" % rx_bytes)
-
+        self._check_nak(rx_bytes, ignore_error)
         return rx_bytes
 
+    def _check_nak(self, rx_bytes, ignore_error=False):
+        if rx_bytes is None or ignore_error:
+            return
+        if rx_bytes[0] != ERROR_OK:
+            raise Exception("Received NAK response: %r" % rx_bytes)
+
     def _flush_rx(self):
-        num_bytes = self.serial.in_waiting
-        if num_bytes:
-            self.serial.read(num_bytes)
+        self.serial.reset_input_buffer()
 
     def _flush_tx(self):
         self.serial.flush()
 
 
+def _frame(data, args=b''):
+    '''Lay out a command packet (length byte, data, args) in a single
+    allocation of its final size'''
+    packet = bytearray(1 + len(data) + len(args))
+    _frame_into(packet, data, args)
+    return packet
+
+def _frame_into(buf, data, args=b''):
+    '''Lay out a command packet (length byte, data, args) at the start
+    of buf and return its length'''
+    size = len(data) + len(args)
+    buf[0] = size # raises ValueError if too long for the length byte
+    buf[1:len(data) + 1] = data
+    buf[len(data) + 1:size + 1] = args
+    return size + 1
+
+
 class UpdEmulatorState(object):
+    # matches the order of _dump_upd_state_to_uart() in cmd.c
+    STRUCT = struct.Struct('<BBB?B25s8s112s1s')
+    FIELDS = (
+        'ram_area',
+        'ram_size',
+        'address',
+        'increment',
+        'dirty_flags',
+        'display_ram',
+        'pictograph_ram',
+        'chargen_ram',
+        'led_ram',
+        )
+
     def __init__(self, data):
-        assert len(data) == 151
-        self.ram_area = data[0]
-        self.ram_size = data[1]
-        self.address = data[2]
-        self.increment = bool(data[3])
-        self.dirty_flags = data[4]
-        self.display_ram = data[5:30]
-        self.pictograph_ram = data[30:38]
-        self.chargen_ram = data[38:150]
-        self.led_ram = data[150:151]
+        assert len(data) == self.STRUCT.size
+        self.__dict__.update(zip(self.FIELDS, self.STRUCT.unpack_from(data)))
+        # struct unpacks the ram areas as bytes.  keep them bytearrays so
+        # indexing them gives ints on python 2 also.
+        self.display_ram = bytearray(self.display_ram)
+        self.pictograph_ram = bytearray(self.pictograph_ram)
+        self.chargen_ram = bytearray(self.chargen_ram)
+        self.led_ram = bytearray(self.led_ram)
 
     def __repr__(self):
         return '<%s: %s> ' % (self.__class__.__name__, repr(self.__dict__))
@@ -253,33 +365,44 @@ class UpdEmulatorState(object):
 
 
 class RadioState(object):
+    # little endian, matches the order of _do_radio_state_dump() in cmd.c
+    STRUCT = struct.Struct('<BBBHbbbbbBBBHHBB11sBBBB7s7sHH')
+    FIELDS = (
+        'operation_mode',
+        'display_mode',
+        'safe_tries',
+        'safe_code',
+        'sound_bass',
+        'sound_treble',
+        'sound_midrange',
+        'sound_balance',
+        'sound_fade',
+        'tape_side',
+        'cd_disc',
+        'cd_track',
+        'cd_track_pos',
+        'tuner_freq',
+        'tuner_preset',
+        'tuner_band',
+        'display',
+        'option_on_vol',
+        'option_cd_mix',
+        'option_tape_skip',
+        'test_fern',
+        'test_rad',
+        'test_ver',
+        'test_signal_freq',
+        'test_signal_strength',
+        )
+
     def __init__(self, data):
-        assert len(data) == 52
-        self.operation_mode = data[0]
-        self.display_mode = data[1]
-        self.safe_tries = data[2]
-        self.safe_code = (data[3] + (data[4] << 8))
-        self.sound_bass =     struct.unpack('b', bytearray([data[5]]))[0]
-        self.sound_treble =   struct.unpack('b', bytearray([data[6]]))[0]
-        self.sound_midrange = struct.unpack('b', bytearray([data[7]]))[0]
-        self.sound_balance =  struct.unpack('b', bytearray([data[8]]))[0]
-        self.sound_fade =     struct.unpack('b', bytearray([data[9]]))[0]
-        self.tape_side = data[10]
-        self.cd_disc = data[11]
-        self.cd_track = data[12]
-        self.cd_track_pos = (data[13] + (data[14] << 8))
-        self.tuner_freq = (data[15] + (data[16] << 8))
-        self.tuner_preset = data[17]
-        self.tuner_band = data[18]
-        self.display = data[19:30]
-        self.option_on_vol = data[30]
-        self.option_cd_mix = data[31]
-        self.option_tape_skip = data[32]
-        self.test_fern = data[33]
-        self.test_rad = data[34:41]
-        self.test_ver = data[41:48]
-        self.test_signal_freq = (data[48] + (data[49] << 8))
-        self.test_signal_strength = (data[50] + (data[51] << 8))
+        assert len(data) == self.STRUCT.size
+        self.__dict__.update(zip(self.FIELDS, self.STRUCT.unpack_from(data)))
+        # struct unpacks the text fields as bytes.  keep them bytearrays
+        # so indexing them gives ints on python 2 also.
+        self.display = bytearray(self.display)
+        self.test_rad = bytearray(self.test_rad)
+        self.test_ver = bytearray(self.test_ver)
 
     def __repr__(self):
         return '<%s: %s> ' % (self.__class__.__name__, repr(self.__dict__))
@@ -293,7 +416,21 @@ def make_serial():
     names = [ x.device for x in comports() if 'Bluetooth' not in x.device ]
     if not names:
         raise Exception("No serial port found")
-    return serial.Serial(port=names[0], baudrate=115200, timeout=2)
+    # reads block until all of the bytes asked for arrive or the timeout
+    # passes, so a reply is read whole without polling in_waiting.  there
+    # is no inter byte timeout so a slow reply isn't cut short, and writes
+    # also time out in case the AVR stops reading.
+    ser = serial.Serial(port=names[0], baudrate=115200, timeout=2,
+                        write_timeout=2, inter_byte_timeout=None)
+    # USB serial adapters buffer received bytes for up to 16 ms by default
+    # before passing them on.  every command waits for a short reply, so
+    # ask for low latency where pyserial supports it (Linux only).  other
+    # posix platforms like macOS raise NotImplementedError.
+    try:
+        ser.set_low_latency_mode(True)
+    except (AttributeError, IOError, ValueError, NotImplementedError):
+        pass
+    return ser
 
 def make_client(serial=None):
     if serial is None:
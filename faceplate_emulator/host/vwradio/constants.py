@@ -3,10 +3,16 @@ class Enum(object):
     '''Abstract'''
     @classmethod
     def get_name(klass, value):
-        for k, v in klass.__dict__.items():
-            if v == value:
-                return k
-        return None
+        # names by value are built on first use and cached on each
+        # subclass itself, so subclasses don't share a parent's cache
+        names = klass.__dict__.get('_names_by_value')
+        if names is None:
+            names = {}
+            for k, v in klass.__dict__.items():
+                if not k.startswith('_'):
+                    names.setdefault(v, k)
+            klass._names_by_value = names
+        return names.get(value)
 
 class OperationModes(Enum):
     UNKNOWN = 0
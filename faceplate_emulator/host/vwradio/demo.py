@@ -39,22 +39,24 @@ class Demo(object):
             start_address = addresses[pos + len(char_codes) - 1]
             char_codes = char_codes[::-1] # reverse it
 
-        # send Data Setting command: write to display ram
-        self.client.faceplate_upd_send_command([0x40])
+        with self.client.pipeline():
+            # send Data Setting command: write to display ram
+            self.client.faceplate_upd_send_command([0x40])
 
-        # send Address Setting command plus data to write to display ram
-        data = [0x80 + start_address] + list(char_codes)
-        self.client.faceplate_upd_send_command(data)
+            # send Address Setting command plus data to write to display ram
+            data = [0x80 + start_address] + list(char_codes)
+            self.client.faceplate_upd_send_command(data)
 
     def define_char(self, index, data):
         if index not in range(16):
             raise ValueError("Character number %r is not 0-15", index)
         if len(data) != 7:
             raise ValueError("Character data length %r is not 7" % len(data))
-        # Data Setting command: write to chargen ram
-        self.client.faceplate_upd_send_command([0x4a])
-        # Address Setting command, data
-        self.client.faceplate_upd_send_command([0x80 + index] + list(data))
+        with self.client.pipeline():
+            # Data Setting command: write to chargen ram
+            self.client.faceplate_upd_send_command([0x4a])
+            # Address Setting command, data
+            self.client.faceplate_upd_send_command([0x80 + index] + list(data))
 
 
 class ShowCharsetDemo(Demo):
@@ -1,5 +1,50 @@
+import struct
 from vwradio.constants import OperationModes, DisplayModes, TunerBands
 
+# the radio blanks the display by writing nuls, which are ignored
+_BLANK = b"\x00" * 11
+
+# fixed fields of the 11 byte displays, unpacked without slicing
+_TUNER_FIELDS = struct.Struct('4s4s3s') # b"FM16" b"1079" b"MHZ"
+_SOUND_LEVEL_FIELDS = struct.Struct('6xcxc2x') # b"BASS  - 9  " -> b"-" b"9"
+_SOUND_SIDE_FIELDS = struct.Struct('4xc5xc') # b"BAL LEFT  9" -> b"L" b"9"
+
+# value of each single digit byte, so a one byte field is checked and
+# converted with one lookup instead of isdigit() and int()
+_DIGITS = dict((str(n).encode('ascii'), n) for n in range(10))
+
+# fm band of each band name, resolved once so the tuner parsers do not
+# look up the TunerBands attributes or build a tuple on every display
+_FM_BANDS = {b"FM1": TunerBands.FM1, b"FM2": TunerBands.FM2}
+_FM_TUNER_BANDS = frozenset(_FM_BANDS.values())
+
+# tape displays are a fixed set, so each is matched whole with one lookup.
+# the value is (operation mode, tape side) where a side of None means
+# the display does not change it.
+_TAPE_DISPLAYS = {
+    b"TAPE PLAY A": (OperationModes.TAPE_PLAYING, 1),
+    b"TAPE PLAY B": (OperationModes.TAPE_PLAYING, 2),
+    b"TAPE SCAN A": (OperationModes.TAPE_SCANNING, 1),
+    b"TAPE SCAN B": (OperationModes.TAPE_SCANNING, 2),
+    b"TAPE  FF   ": (OperationModes.TAPE_FF, None),
+    b"TAPE  REW  ": (OperationModes.TAPE_REW, None),
+    b"TAPEMSS FF ": (OperationModes.TAPE_MSS_FF, None),
+    b"TAPEMSS REW": (OperationModes.TAPE_MSS_REW, None),
+    b"TAPE  BLS  ": (OperationModes.TAPE_BLS, None),
+    b"TAPE METAL ": (OperationModes.TAPE_METAL, None),
+    b"    NO TAPE": (OperationModes.TAPE_NO_TAPE, 0),
+    b"TAPE ERROR ": (OperationModes.TAPE_ERROR, 0),
+    b"TAPE LOAD  ": (OperationModes.TAPE_LOAD, 0),
+    }
+
+# cd displays that show no disc or track, matched whole
+_CD_STOPPED_DISPLAYS = {
+    b"CHK MAGAZIN": OperationModes.CD_CHECK_MAGAZINE,
+    b"NO  CHANGER": OperationModes.CD_NO_CHANGER,
+    b"NO  MAGAZIN": OperationModes.CD_NO_MAGAZINE,
+    b"    NO DISC": OperationModes.CD_NO_DISC,
+    }
+
 class Radio(object):
     def __init__(self):
         self.operation_mode = OperationModes.UNKNOWN
@@ -28,60 +73,59 @@ class Radio(object):
         self.test_signal_strength = 0 # Premium 5 only, 0 to 0xFFFF
 
     def parse(self, display):
-        if display == b' ' * 11:
-            pass # blank
-        elif display == b"     DIAG  ":
-            self._parse_diag(display)
+        # the parsers below compare and look up bytes, so the display is
+        # converted once here.  it may be a bytearray like the ram dumps
+        # from the uPD16432B or text.
+        if not isinstance(display, bytes):
+            if isinstance(display, type(u'')):
+                display = display.encode('ascii')
+            else:
+                display = bytes(display)
+
+        if display == _BLANK:
+            return
+
+        if len(display) != 11: # all displays are 11 bytes, as in the AVR
+            self._parse_unknown(display)
+
+        # displays that are matched whole or by their first three bytes
+        # are found with a dict lookup.  displays parsed in the chain
+        # below are checked in order, so the earlier checks win.
+        parser = self._PARSERS_BY_DISPLAY.get(display)
+        if parser is not None:
+            parser(self, display)
         elif display[6:9] in (b"MIN", b"MAX"):
             self._parse_volume(display)
         elif display[0:1].isdigit() and display[1:2] == b" ":
             self._parse_safe(display)
         elif display[0:4] == b"    " and display[9:11] == b"  ":
             self._parse_safe(display)
-        elif display == b"    NO CODE":
-            self._parse_safe(display)
-        elif display == b"    INITIAL":
-            self._parse_initial(display)
-        elif display == b"    MONSOON":
-            self._parse_monsoon(display)
-        elif display[0:3] == b"BAS":
-            self._parse_sound_bass(display)
-        elif display[0:3] == b"TRE":
-            self._parse_sound_treble(display)
-        elif display[0:3] == b"MID":
-            self._parse_sound_midrange(display)
-        elif display[0:3] == b"BAL":
-            self._parse_sound_balance(display)
-        elif display[0:3] == b"FAD":
-            self._parse_sound_fade(display)
-        elif display[0:3] == b"SET" or display[0:9] == b"TAPE SKIP":
+        elif display[0:9] == b"TAPE SKIP":
             self._parse_set(display)
-        elif display[0:3] in (b"FER", b"RAD", b"VER", b"Ver"):
-            self._parse_test(display)
+        elif display[0:3] in self._PARSERS_BY_PREFIX:
+            self._PARSERS_BY_PREFIX[display[0:3]](self, display)
         elif display[1:4].isdigit():
             self._parse_test(display)
-        elif display[0:3] == b"TAP" or display == b"    NO TAPE":
-            self._parse_tape(display)
         elif display[0:2] == b"CD" or display[4:6] == b"CD":
             self._parse_cd(display)
-        elif display[0:3] in (b"CHK", b"CUE", b"REV"):
-            self._parse_cd(display)
-        elif display in (b"NO  CHANGER", b"NO  MAGAZIN", b"    NO DISC"):
-            self._parse_cd(display)
-        elif display[8:11] in (b"MHZ", b"MHz"):
-            self._parse_tuner_fm(display)
-        elif display[8:11] in (b"KHZ", b"kHz"):
-            self._parse_tuner_am(display)
         else:
-            self._parse_unknown(display)
+            # the unit is case folded by itself because the rest of
+            # the display is case sensitive (b"Vers" and b"VER")
+            unit = display[8:11].upper() # b"MHZ", b"MHz", b"KHZ", b"kHz"
+            if unit == b"MHZ":
+                self._parse_tuner_fm(display)
+            elif unit == b"KHZ":
+                self._parse_tuner_am(display)
+            else:
+                self._parse_unknown(display)
+
+    def _parse_blank(self, display):
+        pass
 
     def _parse_safe(self, display):
         self.display_mode = DisplayModes.SHOWING_OPERATION
 
-        if display[0:1].isdigit():
-            self.safe_tries = int(display[0:1])
-        else:
-            self.safe_tries = 0
+        self.safe_tries = _DIGITS.get(display[0:1], 0)
 
         if display == b"    NO CODE":
             self.operation_mode = OperationModes.SAFE_NO_CODE
@@ -168,35 +212,28 @@ class Radio(object):
 
     def _parse_tuner_fm(self, display):
         self.display_mode = DisplayModes.SHOWING_OPERATION
+        band, freq, _ = _TUNER_FIELDS.unpack_from(display)
 
-        freq = display[4:8]
         if freq[0:1] == b" ": # b" 881"
             freq = b"0" + freq[1:]
         self.tuner_freq = int(freq) # 102.3 MHz = 1023
 
-        if display[0:4] == b"SCAN":
+        if band == b"SCAN":
             self.operation_mode = OperationModes.TUNER_SCANNING
             self.tuner_preset = 0
-            if self.tuner_band not in (TunerBands.FM1, TunerBands.FM2):
+            if self.tuner_band not in _FM_TUNER_BANDS:
                 self.tuner_band = TunerBands.FM1
-        elif display[0:3] in (b"FM1", b"FM2"):
+        elif band[0:3] in _FM_BANDS:
             self.operation_mode = OperationModes.TUNER_PLAYING
-            if display[2:3] == b"1":
-                self.tuner_band = TunerBands.FM1
-            else: # b"2"
-                self.tuner_band = TunerBands.FM2
-
-            if display[3:4].isdigit():
-                self.tuner_preset = int(display[3:4])
-            else: # " " no preset
-                self.tuner_preset = 0
+            self.tuner_band = _FM_BANDS[band[0:3]]
+            self.tuner_preset = _DIGITS.get(band[3:4], 0) # 0=no preset
         else:
             self._parse_unknown(display)
 
     def _parse_tuner_am(self, display):
         self.display_mode = DisplayModes.SHOWING_OPERATION
+        band, freq, _ = _TUNER_FIELDS.unpack_from(display)
 
-        freq = display[4:8]
         if freq[0:1] == b" ": # " 540"
             freq = b"0" + freq[1:]
         if freq.isdigit():
@@ -204,35 +241,17 @@ class Radio(object):
 
         self.tuner_band = TunerBands.AM
 
-        if display[0:4] == b"SCAN":
+        if band == b"SCAN":
             self.operation_mode = OperationModes.TUNER_SCANNING
             self.tuner_preset = 0
         else:
             self.operation_mode = OperationModes.TUNER_PLAYING
-            if display[3:4].isdigit():
-                self.tuner_preset = int(display[3:4])
-            else: # no preset
-                self.tuner_preset = 0
+            self.tuner_preset = _DIGITS.get(band[3:4], 0) # 0=no preset
 
     def _parse_cd(self, display):
         self.display_mode = DisplayModes.SHOWING_OPERATION
-        if display == b"CHK MAGAZIN":
-            self.operation_mode = OperationModes.CD_CHECK_MAGAZINE
-            self.cd_disc = 0
-            self.cd_track = 0
-            self.cd_track_pos = 0
-        elif display == b"NO  CHANGER":
-            self.operation_mode = OperationModes.CD_NO_CHANGER
-            self.cd_disc = 0
-            self.cd_track = 0
-            self.cd_track_pos = 0
-        elif display == b"NO  MAGAZIN":
-            self.operation_mode = OperationModes.CD_NO_MAGAZINE
-            self.cd_disc = 0
-            self.cd_track = 0
-            self.cd_track_pos = 0
-        elif display == b"    NO DISC":
-            self.operation_mode = OperationModes.CD_NO_DISC
+        if display in _CD_STOPPED_DISPLAYS:
+            self.operation_mode = _CD_STOPPED_DISPLAYS[display]
             self.cd_disc = 0
             self.cd_track = 0
             self.cd_track_pos = 0
@@ -280,57 +299,21 @@ class Radio(object):
         if display[4:5] == b'-' or display[5:6] == b'-':
             self.cd_track_pos = 0
         else:
-            minutes = 0
-            if display[5:6].isdigit():
-                minutes += int(display[5:6]) * 10
-            if display[6:7].isdigit():
-                minutes += int(display[6:7])
-
-            seconds = 0
-            if display[7:8].isdigit():
-                seconds += int(display[7:8]) * 10
-            if display[8:9].isdigit():
-                seconds += int(display[8:9])
+            # non-digits count as zero
+            minutes = (_DIGITS.get(display[5:6], 0) * 10 +
+                       _DIGITS.get(display[6:7], 0))
+            seconds = (_DIGITS.get(display[7:8], 0) * 10 +
+                       _DIGITS.get(display[8:9], 0))
 
             self.cd_track_pos = (minutes * 60) + seconds
 
     def _parse_tape(self, display):
         self.display_mode = DisplayModes.SHOWING_OPERATION
-        if display in (b"TAPE PLAY A", b"TAPE PLAY B"):
-            self.operation_mode = OperationModes.TAPE_PLAYING
-            if display[10:11] == b"A":
-                self.tape_side = 1
-            else: # "B"
-                self.tape_side = 2
-        elif display in (b"TAPE SCAN A", b"TAPE SCAN B"):
-            self.operation_mode = OperationModes.TAPE_SCANNING
-            if display[10:11] == b"A":
-                self.tape_side = 1
-            else: # "B"
-                self.tape_side = 2
-        elif display in (b"TAPE  FF   ", b"TAPE  REW  "):
-            if display[6:9] == b"REW":
-                self.operation_mode = OperationModes.TAPE_REW
-            else: # "FF "
-                self.operation_mode = OperationModes.TAPE_FF
-        elif display in (b"TAPEMSS FF ", b"TAPEMSS REW"):
-            if display[8:11] == b"REW":
-                self.operation_mode = OperationModes.TAPE_MSS_REW
-            else: # "FF "
-                self.operation_mode = OperationModes.TAPE_MSS_FF
-        elif display == b"TAPE  BLS  ":
-            self.operation_mode = OperationModes.TAPE_BLS
-        elif display == b"TAPE METAL ":
-            self.operation_mode = OperationModes.TAPE_METAL
-        elif display == b"    NO TAPE":
-            self.operation_mode = OperationModes.TAPE_NO_TAPE
-            self.tape_side = 0
-        elif display == b"TAPE ERROR ":
-            self.operation_mode = OperationModes.TAPE_ERROR
-            self.tape_side = 0
-        elif display == b"TAPE LOAD  ":
-            self.operation_mode = OperationModes.TAPE_LOAD
-            self.tape_side = 0
+        mode_and_side = _TAPE_DISPLAYS.get(display)
+        if mode_and_side is not None:
+            self.operation_mode, tape_side = mode_and_side
+            if tape_side is not None:
+                self.tape_side = tape_side
         else:
             self._parse_unknown(display)
 
@@ -339,52 +322,89 @@ class Radio(object):
 
     def _parse_sound_balance(self, display):
         self.display_mode = DisplayModes.ADJUSTING_SOUND_BALANCE
-        if display[4:5] == b"C":
+        side, level = _SOUND_SIDE_FIELDS.unpack_from(display)
+        if side == b"C":
             self.sound_balance = 0  # Center
-        elif display[4:5] == b"R" and display[10:11].isdigit():
-            self.sound_balance = int(display[10:11])  # Right
-        elif display[4:5] == b"L" and display[10:11].isdigit():
-            self.sound_balance = -int(display[10:11])  # Left
+        elif side == b"R" and level in _DIGITS:
+            self.sound_balance = _DIGITS[level]  # Right
+        elif side == b"L" and level in _DIGITS:
+            self.sound_balance = -_DIGITS[level]  # Left
         else:
             self._parse_unknown(display)
 
     def _parse_sound_fade(self, display):
         self.display_mode = DisplayModes.ADJUSTING_SOUND_FADE
-        if display[4:5] == b"C":
+        side, level = _SOUND_SIDE_FIELDS.unpack_from(display)
+        if side == b"C":
             self.sound_fade = 0  # Center
-        elif display[4:5] == b"F" and display[10:11].isdigit():
-            self.sound_fade = int(display[10:11])  # Front
-        elif display[4:5] == b"R" and display[10:11].isdigit():
-            self.sound_fade = -int(display[10:11])  # Rear
+        elif side == b"F" and level in _DIGITS:
+            self.sound_fade = _DIGITS[level]  # Front
+        elif side == b"R" and level in _DIGITS:
+            self.sound_fade = -_DIGITS[level]  # Rear
         else:
             self._parse_unknown(display)
 
     def _parse_sound_bass(self, display):
         self.display_mode = DisplayModes.ADJUSTING_SOUND_BASS
-        if display[8:9].isdigit():
-            self.sound_bass = int(display[8:9])
-            if display[6:7] == b"-":
+        sign, level = _SOUND_LEVEL_FIELDS.unpack_from(display)
+        level = _DIGITS.get(level)
+        if level is not None:
+            self.sound_bass = level
+            if sign == b"-":
                 self.sound_bass = self.sound_bass * -1
         else:
             self._parse_unknown(display)
 
     def _parse_sound_treble(self, display):
         self.display_mode = DisplayModes.ADJUSTING_SOUND_TREBLE
-        if display[8:9].isdigit():
-            self.sound_treble = int(display[8:9])
-            if display[6:7] == b"-":
+        sign, level = _SOUND_LEVEL_FIELDS.unpack_from(display)
+        level = _DIGITS.get(level)
+        if level is not None:
+            self.sound_treble = level
+            if sign == b"-":
                 self.sound_treble = self.sound_treble * -1
         else:
             self._parse_unknown(display)
 
     def _parse_sound_midrange(self, display):
         self.display_mode = DisplayModes.ADJUSTING_SOUND_MIDRANGE
-        if display[8:9].isdigit():
-            self.sound_midrange = int(display[8:9])
-            if display[6:7] == b"-":
+        sign, level = _SOUND_LEVEL_FIELDS.unpack_from(display)
+        level = _DIGITS.get(level)
+        if level is not None:
+            self.sound_midrange = level
+            if sign == b"-":
                 self.sound_midrange = self.sound_midrange * -1
         else:
             self._parse_unknown(display)
 
     def _parse_unknown(self, display):
         raise ValueError("Unrecognized: %r" % display)
+
+    _PARSERS_BY_DISPLAY = {
+        b"           ": _parse_blank,
+        b"     DIAG  ": _parse_diag,
+        b"    NO CODE": _parse_safe,
+        b"    INITIAL": _parse_initial,
+        b"    MONSOON": _parse_monsoon,
+        b"    NO TAPE": _parse_tape,
+        b"NO  CHANGER": _parse_cd,
+        b"NO  MAGAZIN": _parse_cd,
+        b"    NO DISC": _parse_cd,
+        }
+
+    _PARSERS_BY_PREFIX = {
+        b"BAS": _parse_sound_bass,
+        b"TRE": _parse_sound_treble,
+        b"MID": _parse_sound_midrange,
+        b"BAL": _parse_sound_balance,
+        b"FAD": _parse_sound_fade,
+        b"SET": _parse_set,
+        b"FER": _parse_test,
+        b"RAD": _parse_test,
+        b"VER": _parse_test,
+        b"Ver": _parse_test,
+        b"TAP": _parse_tape,
+        b"CHK": _parse_cd,
+        b"CUE": _parse_cd,
+        b"REV": _parse_cd,
+        }
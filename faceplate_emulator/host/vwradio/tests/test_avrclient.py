@@ -0,0 +1,189 @@
+import unittest
+from vwradio import avrclient
+
+class FakeSerial(object):
+    '''Stands in for the AVR on the other end of the serial port.  It
+    replies to each complete packet written to it with an ack, or a NAK
+    for commands in nak_commands, and echoes back the args of an echo
+    command.  Replies are still in flight when the input buffer is reset,
+    so they are only dropped by reading them.'''
+
+    def __init__(self, nak_commands=()):
+        self.nak_commands = nak_commands
+        self.writes = []
+        self._unparsed = bytearray()
+        self._replies = bytearray()
+
+    def write(self, data):
+        self.writes.append(bytes(bytearray(data)))
+        self._unparsed += data
+        while self._unparsed and len(self._unparsed) > self._unparsed[0]:
+            size = self._unparsed[0]
+            packet = self._unparsed[1:size + 1]
+            del self._unparsed[:size + 1]
+            if packet[0] in self.nak_commands:
+                reply = bytearray([avrclient.ERROR_BAD_ARGS_VALUE])
+            else:
+                reply = bytearray([avrclient.ERROR_OK])
+            if packet[0] == avrclient.CMD_ECHO:
+                reply += packet[1:]
+            self._replies += bytearray([len(reply)]) + reply
+        return len(data)
+
+    def read(self, size=1):
+        data = bytes(self._replies[:size])
+        del self._replies[:size]
+        return data
+
+    def flush(self):
+        pass
+
+    def reset_input_buffer(self):
+        pass
+
+class TestClient(unittest.TestCase):
+    def test_pipeline_sends_queued_commands_in_one_write(self):
+        serial = FakeSerial()
+        client = avrclient.Client(serial)
+        with client.pipeline():
+            client.set_led(avrclient.LED_GREEN, True)
+            client.set_led(avrclient.LED_RED, False)
+            self.assertEqual(serial.writes, [])
+        self.assertEqual(len(serial.writes), 1)
+        self.assertEqual(client.echo(b'hello'), b'hello')
+
+    def test_pipeline_sends_queued_commands_with_command_returning_data(self):
+        serial = FakeSerial()
+        client = avrclient.Client(serial)
+        with client.pipeline():
+            client.set_led(avrclient.LED_GREEN, True)
+            self.assertEqual(client.echo(b'hello'), b'hello')
+            self.assertEqual(len(serial.writes), 1)
+        self.assertEqual(len(serial.writes), 1)
+
+    def test_nested_pipeline_sends_when_outer_block_exits(self):
+        serial = FakeSerial()
+        client = avrclient.Client(serial)
+        with client.pipeline():
+            client.set_led(avrclient.LED_GREEN, True)
+            with client.pipeline():
+                client.set_led(avrclient.LED_RED, True)
+            self.assertEqual(serial.writes, [])
+            client.set_led(avrclient.LED_RED, False)
+        self.assertEqual(len(serial.writes), 1)
+        self.assertEqual(client.echo(b'hello'), b'hello')
+
+    def test_pipeline_splits_writes_at_max_queued(self):
+        serial = FakeSerial()
+        client = avrclient.Client(serial)
+        display = b'FM161079MHZ' # 13 byte packet
+        packets_per_write = avrclient.PIPELINE_MAX_QUEUED // 13
+        with client.pipeline():
+            for i in range(packets_per_write + 1):
+                client.radio_state_parse(display)
+        self.assertEqual([len(w) for w in serial.writes],
+                         [packets_per_write * 13, 13])
+        self.assertEqual(client.echo(b'hello'), b'hello')
+
+    def test_pipeline_reads_all_replies_before_raising_nak(self):
+        serial = FakeSerial(nak_commands=[avrclient.CMD_SET_LED])
+        client = avrclient.Client(serial)
+        try:
+            with client.pipeline():
+                client.radio_state_reset()
+                client.set_led(avrclient.LED_GREEN, True) # nak
+                client.radio_state_reset()
+                client.radio_state_reset()
+            self.fail('nothing raised')
+        except Exception as exc:
+            self.assertTrue('NAK' in str(exc))
+        self.assertEqual(client.echo(b'hello'), b'hello')
+
+    def test_pipeline_command_reads_its_reply_before_raising_nak(self):
+        serial = FakeSerial(nak_commands=[avrclient.CMD_SET_LED])
+        client = avrclient.Client(serial)
+        try:
+            with client.pipeline():
+                client.set_led(avrclient.LED_GREEN, True) # nak
+                client.echo(b'lost')
+            self.fail('nothing raised')
+        except Exception as exc:
+            self.assertTrue('NAK' in str(exc))
+        self.assertEqual(client.echo(b'hello'), b'hello')
+
+class TestUpdEmulatorState(unittest.TestCase):
+    def test_unpacks_ram_areas_as_bytearrays(self):
+        data = bytearray([0xFF, 0, 0, 1, 0]) + bytearray(range(146))
+        state = avrclient.UpdEmulatorState(data)
+        self.assertEqual(state.ram_area, avrclient.UPD_RAM_NONE)
+        self.assertTrue(state.increment)
+        self.assertEqual(state.display_ram, bytearray(range(0, 25)))
+        self.assertEqual(state.pictograph_ram, bytearray(range(25, 33)))
+        self.assertEqual(state.chargen_ram, bytearray(range(33, 145)))
+        self.assertEqual(state.led_ram, bytearray([145]))
+        for name in ('display_ram', 'pictograph_ram', 'chargen_ram',
+                     'led_ram'):
+            self.assertTrue(isinstance(getattr(state, name), bytearray))
+        self.assertEqual(state.display_ram[5], 5)
+
+class TestRadioState(unittest.TestCase):
+    def test_unpacks_text_fields_as_bytearrays(self):
+        data = bytearray(avrclient.RadioState.STRUCT.size)
+        data[19:30] = b'FM161079MHZ'
+        data[34:41] = b'3CP T7 '
+        data[41:48] = b' 0702  '
+        state = avrclient.RadioState(data)
+        self.assertEqual(state.display, bytearray(b'FM161079MHZ'))
+        self.assertEqual(state.test_rad, bytearray(b'3CP T7 '))
+        self.assertEqual(state.test_ver, bytearray(b' 0702  '))
+        for name in ('display', 'test_rad', 'test_ver'):
+            self.assertTrue(isinstance(getattr(state, name), bytearray))
+        self.assertEqual(state.display[0], ord('F'))
+
+class TestMakeSerial(unittest.TestCase):
+    def test_ignores_low_latency_mode_not_implemented(self):
+        class FakePortInfo(object):
+            device = '/dev/cu.usbserial'
+
+        class FakeSerialPort(object):
+            def __init__(self, **kwargs):
+                self.kwargs = kwargs
+
+            def set_low_latency_mode(self, low_latency):
+                # what pyserial does on macOS and the BSDs
+                raise NotImplementedError(
+                    'Low latency not supported on this platform')
+
+        import serial.tools.list_ports
+        saved = (serial.tools.list_ports.comports, avrclient.serial.Serial)
+        serial.tools.list_ports.comports = lambda: [FakePortInfo()]
+        avrclient.serial.Serial = FakeSerialPort
+        try:
+            ser = avrclient.make_serial()
+        finally:
+            serial.tools.list_ports.comports, avrclient.serial.Serial = saved
+        self.assertTrue(isinstance(ser, FakeSerialPort))
+        self.assertEqual(ser.kwargs['port'], '/dev/cu.usbserial')
+
+class TestReceive(unittest.TestCase):
+    def test_zero_length_header_does_not_read_next_reply(self):
+        serial = FakeSerial()
+        serial._replies += bytearray([0]) # invalid: no error byte
+        serial._replies += bytearray([1, avrclient.ERROR_OK])
+        client = avrclient.Client(serial)
+        try:
+            client.receive()
+            self.fail('nothing raised')
+        except Exception as exc:
+            self.assertTrue('not ack/nak' in str(exc))
+        self.assertEqual(client.receive(), bytearray([avrclient.ERROR_OK]))
+
+    def test_short_reply_raises_timeout(self):
+        serial = FakeSerial()
+        serial._replies += bytearray([3, avrclient.ERROR_OK])
+        client = avrclient.Client(serial)
+        try:
+            client.receive()
+            self.fail('nothing raised')
+        except Exception as exc:
+            self.assertTrue('Timeout' in str(exc))
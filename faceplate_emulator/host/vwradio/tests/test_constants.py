@@ -0,0 +1,24 @@
+import unittest
+from vwradio.constants import Enum, OperationModes, Keys
+
+class TestEnum(unittest.TestCase):
+    def test_get_name_returns_name_of_value(self):
+        self.assertEqual(OperationModes.get_name(OperationModes.TUNER_PLAYING),
+            'TUNER_PLAYING')
+        self.assertEqual(Keys.get_name(Keys.PRESET_1), 'PRESET_1')
+
+    def test_get_name_returns_none_for_unknown_value(self):
+        self.assertEqual(OperationModes.get_name(0xFFFF), None)
+
+    def test_get_name_ignores_private_attributes(self):
+        self.assertEqual(OperationModes.get_name(OperationModes.__module__),
+            None)
+
+    def test_get_name_looks_up_only_its_own_class(self):
+        class Colors(Enum):
+            RED = 1
+        class MoreColors(Colors):
+            GREEN = 2
+        self.assertEqual(Colors.get_name(1), 'RED')
+        self.assertEqual(MoreColors.get_name(2), 'GREEN')
+        self.assertEqual(Colors.get_name(2), None)
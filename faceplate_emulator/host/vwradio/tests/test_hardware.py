@@ -1,4 +1,4 @@
-import itertools
+import contextlib
 import os
 import time
 import unittest
@@ -13,44 +13,148 @@ if 'HARDWARE_TEST' in os.environ:
 else:
     BaseTestCase = object
 
+# uPD16432B ram contents after reset
+UPD_BLANK_DISPLAY_RAM = bytes(bytearray(0x19))
+UPD_BLANK_CHARGEN_RAM = bytes(bytearray(7 * 0x10))
+UPD_BLANK_PICTOGRAPH_RAM = bytes(bytearray(8))
+
+# a unique byte for every address of each uPD16432B ram area
+UPD_DISPLAY_RAM_DATA = bytes(bytearray(range(1, 0x19 + 1)))
+UPD_PICTOGRAPH_RAM_DATA = bytes(bytearray(range(1, 8 + 1)))
+UPD_CHARGEN_RAM_DATA = bytes(bytearray(range(7 * 0x10))) # 16 chars of 7 bytes
+
+# display, safe code, safe tries and operation mode parsed from it
+RADIO_SAFE_MODE_DISPLAYS = (
+    # Premium 4
+    (b"     0000  ",    0, 0, OperationModes.SAFE_ENTRY),
+    (b"1    1234  ", 1234, 1, OperationModes.SAFE_ENTRY),
+    (b"2    5678  ", 5678, 2, OperationModes.SAFE_ENTRY),
+    (b"9    9999  ", 9999, 9, OperationModes.SAFE_ENTRY),
+    (b"    NO CODE",    0, 0, OperationModes.SAFE_NO_CODE),
+    # Premium 5
+    (b"    0000   ",    0, 0, OperationModes.SAFE_ENTRY),
+    (b"1   1234   ", 1234, 1, OperationModes.SAFE_ENTRY),
+    (b"2   5678   ", 5678, 2, OperationModes.SAFE_ENTRY),
+    (b"9   9999   ", 9999, 9, OperationModes.SAFE_ENTRY),
+    # Premium 4 and 5
+    (b"     SAFE  ", 1000, 0, OperationModes.SAFE_LOCKED),
+    (b"1    SAFE  ", 1000, 1, OperationModes.SAFE_LOCKED),
+    (b"2    SAFE  ", 1000, 2, OperationModes.SAFE_LOCKED),
+    (b"9    SAFE  ", 1000, 9, OperationModes.SAFE_LOCKED),
+)
+
+# displays shown while adjusting the volume
+RADIO_SOUND_VOLUME_DISPLAYS = (
+    b"AM    MIN  ",
+    b"AM    MAX  ",
+    b"FM1   MIN  ",
+    b"FM1   MAX  ",
+    b"FM2   MIN  ",
+    b"FM2   MAX  ",
+    b"CD    MIN  ",
+    b"CD    MAX  ",
+    b"TAP   MIN  ",
+    b"TAP   MAX  ",
+)
+
+# display mode, state field, and the displays and values for each
+# sound adjustment
+RADIO_SOUND_ADJUSTMENTS = (
+    (DisplayModes.ADJUSTING_SOUND_BALANCE, 'sound_balance', (
+        (b"BAL LEFT  9", -9),
+        (b"BAL LEFT  1", -1),
+        (b"BAL CENTER ", 0),
+        (b"BAL RIGHT 1", 1),
+        (b"BAL RIGHT 9", 9),
+    )),
+    (DisplayModes.ADJUSTING_SOUND_FADE, 'sound_fade', (
+        (b"FADEREAR  9", -9),
+        (b"FADEREAR  1", -1),
+        (b"FADECENTER ", 0),
+        (b"FADEFRONT 1", 1),
+        (b"FADEFRONT 9", 9),
+    )),
+    (DisplayModes.ADJUSTING_SOUND_BASS, 'sound_bass', (
+        (b"BASS  - 9  ", -9),
+        (b"BASS  - 1  ", -1),
+        (b"BASS    0  ", 0),
+        (b"BASS  + 1  ", 1),
+        (b"BASS  + 9  ", 9),
+    )),
+    (DisplayModes.ADJUSTING_SOUND_TREBLE, 'sound_treble', (
+        (b"TREB  - 9  ", -9),
+        (b"TREB  - 1  ", -1),
+        (b"TREB    0  ", 0),
+        (b"TREB  + 1  ", 1),
+        (b"TREB  + 9  ", 9),
+    )),
+    # midrange is only on the premium 5
+    (DisplayModes.ADJUSTING_SOUND_MIDRANGE, 'sound_midrange', (
+        (b"MID   - 9  ", -9),
+        (b"MID   - 1  ", -1),
+        (b"MID     0  ", 0),
+        (b"MID   + 1  ", 1),
+        (b"MID   + 9  ", 9),
+    )),
+)
+
+@contextlib.contextmanager
+def _no_subtest():
+    yield
+
 class TestAvr(BaseTestCase):
     serial = None # serial.Serial instance
-
-    def setUp(self):
-        if getattr(self, 'serial') is None:
-            self.serial = avrclient.make_serial()
-        self.client = avrclient.Client(self.serial)
-        self.client.set_run_mode(avrclient.RUN_MODE_STOPPED)
-
-    def tearDown(self):
-        self.client.set_run_mode(avrclient.RUN_MODE_RUNNING)
+    client = None # avrclient.Client instance
+
+    # the run mode is set once for the whole class instead of around every
+    # test.  no test changes it, and tests that need a known uPD or radio
+    # state reset it themselves.
+
+    @classmethod
+    def setUpClass(cls):
+        if cls.serial is None:
+            cls.serial = avrclient.make_serial()
+        cls.client = avrclient.Client(cls.serial)
+        cls.client.set_run_mode(avrclient.RUN_MODE_STOPPED)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.client.set_run_mode(avrclient.RUN_MODE_RUNNING)
+
+    def _subtest(self, **params):
+        '''subTest() on Python 3.4 and later.  Older versions don't have
+        it, so the cases of a loop just run in the test itself.'''
+        if hasattr(self, 'subTest'):
+            return self.subTest(**params)
+        return _no_subtest()
 
     # Command timeout
 
-    if 'ALL' in os.environ:
-        def test_timeout_ignores_incomplete_command(self):
-            '''this test takes 2.25 seconds'''
-            # send incomplete command
-            self.client.serial.write(bytearray([42, 1, 2, 3]))
+    @unittest.skipUnless('ALL' in os.environ, 'slow test, set ALL to run')
+    def test_timeout_ignores_incomplete_command(self):
+        '''this test takes 2.25 seconds'''
+        # send incomplete command
+        self.client.serial.write(bytearray([42, 1, 2, 3]))
+        self.client.serial.flush()
+        # wait longer than timeout period
+        time.sleep(2.25)
+        # command should have timed out
+        # next command should complete successfully
+        rx_bytes = self.client.command(
+            data=[avrclient.CMD_ECHO], ignore_error=True)
+        self.assertEqual(rx_bytes, bytearray([avrclient.ERROR_OK]))
+
+    @unittest.skipUnless('ALL' in os.environ, 'slow test, set ALL to run')
+    def test_timeout_timer_resets_after_each_byte(self):
+        '''this test takes 6 seconds'''
+        # send individual bytes very slowly
+        for b in (5,avrclient.CMD_ECHO,4,3,2,1,):
+            self.client.serial.write(bytearray([b]))
             self.client.serial.flush()
-            # wait longer than timeout period
-            time.sleep(2.25)
-            # command should have timed out
-            # next command should complete successfully
-            rx_bytes = self.client.command(
-                data=[avrclient.CMD_ECHO], ignore_error=True)
-            self.assertEqual(rx_bytes, bytearray([avrclient.ERROR_OK]))
-
-        def test_timeout_timer_resets_after_each_byte(self):
-            '''this test takes 6 seconds'''
-            # send individual bytes very slowly
-            for b in (5,avrclient.CMD_ECHO,4,3,2,1,):
-                self.client.serial.write(bytearray([b]))
-                self.client.serial.flush()
-                time.sleep(1)
-            # command should not have timed out
-            rx_bytes = self.client.receive()
-            self.assertEqual(rx_bytes, bytearray([avrclient.ERROR_OK,4,3,2,1,]))
+            time.sleep(1)
+        # command should not have timed out
+        rx_bytes = self.client.receive()
+        self.assertEqual(rx_bytes, bytearray([avrclient.ERROR_OK,4,3,2,1,]))
 
     # Command dispatch
 
@@ -253,6 +357,25 @@ class TestAvr(BaseTestCase):
 
     # uPD16432B Emulator
 
+    def _prepare_upd_ram(self, ram_select_bits, increment_off=False,
+                         address=None, data=b''):
+        '''Reset the emulated uPD16432B, send it a data setting command,
+        and optionally an address setting command followed by data.  The
+        commands are pipelined with the state dump that is returned so
+        they all take one round trip.'''
+        with self.client.pipeline():
+            self.client.emulated_upd_reset()
+            cmd  = 0b01000000 # data setting command
+            cmd |= ram_select_bits
+            if increment_off:
+                cmd |= 0b00001000
+            self.client.emulated_upd_send_command([cmd])
+            if address is not None:
+                cmd  = 0b10000000 # address setting command
+                cmd |= address
+                self.client.emulated_upd_send_command(bytearray([cmd]) + data)
+            return self.client.emulated_upd_dump_state()
+
     def test_upd_resets_to_known_state(self):
         self.client.emulated_upd_reset()
         state = self.client.emulated_upd_dump_state()
@@ -260,107 +383,72 @@ class TestAvr(BaseTestCase):
         self.assertEqual(state.ram_size, 0)
         self.assertEqual(state.address, 0)
         self.assertFalse(state.increment)
-        self.assertEqual(state.display_ram, bytearray(0x19))
-        self.assertEqual(state.chargen_ram, bytearray(7 * 0x10))
-        self.assertEqual(state.pictograph_ram, bytearray(8))
+        self.assertEqual(state.display_ram, UPD_BLANK_DISPLAY_RAM)
+        self.assertEqual(state.chargen_ram, UPD_BLANK_CHARGEN_RAM)
+        self.assertEqual(state.pictograph_ram, UPD_BLANK_PICTOGRAPH_RAM)
 
     # uPD16432B Emulator: Data Setting Command
 
     def test_upd_data_setting_sets_display_ram_area_increment_off(self):
-        self.client.emulated_upd_reset()
-        cmd  = 0b01000000 # data setting command
-        cmd |= 0b00000000 # display ram
-        cmd |= 0b00001000 # increment off
-        self.client.emulated_upd_send_command([cmd])
-        state = self.client.emulated_upd_dump_state()
+        ram_select_bits = 0b00000000 # display ram
+        state = self._prepare_upd_ram(ram_select_bits, increment_off=True)
         self.assertEqual(state.ram_area, avrclient.UPD_RAM_DISPLAY)
         self.assertEqual(state.ram_size, 25)
         self.assertFalse(state.increment)
 
     def test_upd_data_setting_sets_display_ram_area_increment_on(self):
-        self.client.emulated_upd_reset()
-        cmd  = 0b01000000 # data setting command
-        cmd |= 0b00000000 # display ram
-        cmd |= 0b00000000 # increment on
-        self.client.emulated_upd_send_command([cmd])
-        state = self.client.emulated_upd_dump_state()
+        ram_select_bits = 0b00000000 # display ram
+        state = self._prepare_upd_ram(ram_select_bits)
         self.assertEqual(state.ram_area, avrclient.UPD_RAM_DISPLAY)
         self.assertEqual(state.ram_size, 25)
         self.assertTrue(state.increment)
 
     def test_upd_data_setting_sets_pictograph_ram_area_increment_off(self):
-        self.client.emulated_upd_reset()
-        cmd  = 0b01000000 # data setting command
-        cmd |= 0b00000001 # pictograph ram
-        cmd |= 0b00001000 # increment off
-        self.client.emulated_upd_send_command([cmd])
-        state = self.client.emulated_upd_dump_state()
+        ram_select_bits = 0b00000001 # pictograph ram
+        state = self._prepare_upd_ram(ram_select_bits, increment_off=True)
         self.assertEqual(state.ram_area, avrclient.UPD_RAM_PICTOGRAPH)
         self.assertEqual(state.ram_size, 8)
         self.assertFalse(state.increment)
 
     def test_upd_data_setting_sets_chargen_ram_area_increment_on(self):
-        self.client.emulated_upd_reset()
-        cmd  = 0b01000000 # data setting command
-        cmd |= 0b00000010 # chargen ram
-        cmd |= 0b00000000 # increment on
-        self.client.emulated_upd_send_command([cmd])
-        state = self.client.emulated_upd_dump_state()
+        ram_select_bits = 0b00000010 # chargen ram
+        state = self._prepare_upd_ram(ram_select_bits)
         self.assertEqual(state.ram_area, avrclient.UPD_RAM_CHARGEN)
         self.assertEqual(state.ram_size, 112)
         self.assertTrue(state.increment)
 
     def test_upd_data_setting_sets_chargen_ram_area_ignores_increment_off(self):
-        self.client.emulated_upd_reset()
-        cmd  = 0b01000000 # data setting command
-        cmd |= 0b00000010 # chargen ram
-        cmd |= 0b00001000 # increment off (should be ignored)
-        self.client.emulated_upd_send_command([cmd])
-        state = self.client.emulated_upd_dump_state()
+        ram_select_bits = 0b00000010 # chargen ram
+        state = self._prepare_upd_ram(ram_select_bits, increment_off=True) # should be ignored
         self.assertEqual(state.ram_area, avrclient.UPD_RAM_CHARGEN)
         self.assertEqual(state.ram_size, 112)
         self.assertTrue(state.increment) # should ignore increment off
 
     def test_upd_data_setting_sets_led_ram_area_increment_on(self):
-        self.client.emulated_upd_reset()
-        cmd  = 0b01000000 # data setting command
-        cmd |= 0b00000011 # led output latch
-        cmd |= 0b00000000 # increment on
-        self.client.emulated_upd_send_command([cmd])
-        state = self.client.emulated_upd_dump_state()
+        ram_select_bits = 0b00000011 # led output latch
+        state = self._prepare_upd_ram(ram_select_bits)
         self.assertEqual(state.ram_area, avrclient.UPD_RAM_LED)
         self.assertEqual(state.ram_size, 1)
         self.assertTrue(state.increment)
 
     def test_upd_data_setting_sets_led_ram_area_ignores_increment_off(self):
-        self.client.emulated_upd_reset()
-        cmd  = 0b01000000 # data setting command
-        cmd |= 0b00000011 # led output latch
-        cmd |= 0b00001000 # increment off (should be ignored)
-        self.client.emulated_upd_send_command([cmd])
-        state = self.client.emulated_upd_dump_state()
+        ram_select_bits = 0b00000011 # led output latch
+        state = self._prepare_upd_ram(ram_select_bits, increment_off=True) # should be ignored
         self.assertEqual(state.ram_area, avrclient.UPD_RAM_LED)
         self.assertEqual(state.ram_size, 1)
         self.assertTrue(state.increment) # should ignore increment off
 
     def test_upd_data_setting_unrecognized_ram_area_sets_none(self):
-        self.client.emulated_upd_reset()
-        cmd  = 0b01000000 # data setting command
-        cmd |= 0b00000111 # not a valid ram area
-        self.client.emulated_upd_send_command([cmd])
-        state = self.client.emulated_upd_dump_state()
+        ram_select_bits = 0b00000111 # not a valid ram area
+        state = self._prepare_upd_ram(ram_select_bits)
         self.assertEqual(state.ram_area, avrclient.UPD_RAM_NONE)
         self.assertEqual(state.ram_size, 0)
         self.assertEqual(state.address, 0)
         self.assertTrue(state.increment)
 
     def test_upd_data_setting_unrecognized_ram_area_ignores_increment_off(self):
-        self.client.emulated_upd_reset()
-        cmd  = 0b01000000 # data setting command
-        cmd |= 0b00000111 # not a valid ram area
-        cmd |= 0b00001000 # increment off (should be ignored)
-        self.client.emulated_upd_send_command([cmd])
-        state = self.client.emulated_upd_dump_state()
+        ram_select_bits = 0b00000111 # not a valid ram area
+        state = self._prepare_upd_ram(ram_select_bits, increment_off=True) # should be ignored
         self.assertEqual(state.ram_area, avrclient.UPD_RAM_NONE)
         self.assertEqual(state.ram_size, 0)
         self.assertEqual(state.address, 0)
@@ -397,19 +485,11 @@ class TestAvr(BaseTestCase):
             (avrclient.UPD_RAM_LED,          0b00000011,    1,    0), # out of range
         )
         for ram_area, ram_select_bits, address, expected_address in tuples:
-            self.client.emulated_upd_reset()
-            # data setting command
-            cmd  = 0b01000000 # data setting command
-            cmd |= ram_select_bits
-            self.client.emulated_upd_send_command([cmd])
-            state = self.client.emulated_upd_dump_state()
+            # data setting command, then address setting command
+            state = self._prepare_upd_ram(ram_select_bits, address=address)
+            # address setting doesn't change the ram area selected
             self.assertEqual(state.ram_area, ram_area)
-            # address setting command
-            cmd = 0b10000000
-            cmd |= address
-            self.client.emulated_upd_send_command([cmd])
             # address should be as expected
-            state = self.client.emulated_upd_dump_state()
             self.assertEqual(state.address, expected_address)
 
     # uPD16432B Emulator: Writing Data
@@ -426,76 +506,42 @@ class TestAvr(BaseTestCase):
         self.assertEqual(self.client.emulated_upd_dump_state(), state)
 
     def test_upd_writing_display_ram_increment_on_writes_data(self):
-        self.client.emulated_upd_reset()
-        # data setting command
-        cmd  = 0b01000000 # data setting command
-        cmd |= 0b00000000 # display ram
-        cmd |= 0b00000000 # increment on
-        self.client.emulated_upd_send_command([cmd])
-        # address setting command
-        # followed by a unique byte for all 25 bytes of display ram
-        cmd = 0b10000000
-        cmd |= 0 # address 0
-        data = bytearray(range(1, 26))
-        self.client.emulated_upd_send_command(bytearray([cmd]) + data)
-        state = self.client.emulated_upd_dump_state()
+        ram_select_bits = 0b00000000 # display ram
+        # a unique byte for all 25 bytes of display ram
+        data = UPD_DISPLAY_RAM_DATA
+        state = self._prepare_upd_ram(ram_select_bits, address=0, data=data)
         self.assertEqual(state.ram_area, avrclient.UPD_RAM_DISPLAY)
         self.assertTrue(state.increment)
         self.assertEqual(state.address, 0) # wrapped around
         self.assertEqual(state.display_ram, data)
 
     def test_upd_writing_display_ram_increment_off_rewrites_data(self):
-        self.client.emulated_upd_reset()
-        # data setting command
-        cmd  = 0b01000000 # data setting command
-        cmd |= 0b00000000 # display ram
-        cmd |= 0b00001000 # increment off
-        self.client.emulated_upd_send_command([cmd])
-        # address setting command
-        cmd = 0b10000000
-        cmd |= 5 # address 5
-        # address setting command
-        # followed by bytes that should be written to address 5 only
-        self.client.emulated_upd_send_command([cmd, 1, 2, 3, 4, 5, 6, 7])
-        state = self.client.emulated_upd_dump_state()
+        ram_select_bits = 0b00000000 # display ram
+        # bytes that should all be written to address 5
+        data = bytearray([1, 2, 3, 4, 5, 6, 7])
+        state = self._prepare_upd_ram(ram_select_bits, increment_off=True,
+                                      address=5, data=data)
         self.assertEqual(state.ram_area, avrclient.UPD_RAM_DISPLAY)
         self.assertFalse(state.increment)
         self.assertEqual(state.address, 5)
         self.assertEqual(state.display_ram[5], 7)
 
     def test_upd_writing_pictograph_ram_increment_on_writes_data(self):
-        self.client.emulated_upd_reset()
-        # data setting command
-        cmd  = 0b01000000 # data setting command
-        cmd |= 0b00000001 # pictograph ram
-        cmd |= 0b00000000 # increment on
-        self.client.emulated_upd_send_command([cmd])
-        # address setting command
-        # followed by a unique byte for all 8 bytes of pictograph ram
-        cmd = 0b10000000
-        cmd |= 0 # address 0
-        data = bytearray(range(1, 9))
-        self.client.emulated_upd_send_command(bytearray([cmd]) + data)
-        state = self.client.emulated_upd_dump_state()
+        ram_select_bits = 0b00000001 # pictograph ram
+        # a unique byte for all 8 bytes of pictograph ram
+        data = UPD_PICTOGRAPH_RAM_DATA
+        state = self._prepare_upd_ram(ram_select_bits, address=0, data=data)
         self.assertEqual(state.ram_area, avrclient.UPD_RAM_PICTOGRAPH)
         self.assertTrue(state.increment)
         self.assertEqual(state.address, 0) # wrapped around
         self.assertEqual(state.pictograph_ram, data)
 
     def test_upd_writing_pictograph_ram_increment_off_rewrites_data(self):
-        self.client.emulated_upd_reset()
-        # data setting command
-        cmd  = 0b01000000 # data setting command
-        cmd |= 0b00000001 # pictograph ram
-        cmd |= 0b00001000 # increment off
-        self.client.emulated_upd_send_command([cmd])
-        # address setting command
-        cmd = 0b10000000
-        cmd |= 5 # address 5
-        # address setting command
-        # followed by bytes that should be written to address 5 only
-        self.client.emulated_upd_send_command([cmd, 1, 2, 3, 4, 5, 6, 7])
-        state = self.client.emulated_upd_dump_state()
+        ram_select_bits = 0b00000001 # pictograph ram
+        # bytes that should all be written to address 5
+        data = bytearray([1, 2, 3, 4, 5, 6, 7])
+        state = self._prepare_upd_ram(ram_select_bits, increment_off=True,
+                                      address=5, data=data)
         self.assertEqual(state.ram_area, avrclient.UPD_RAM_PICTOGRAPH)
         self.assertFalse(state.increment)
         self.assertEqual(state.address, 5)
@@ -508,26 +554,23 @@ class TestAvr(BaseTestCase):
         cmd |= 0b00000010 # chargen ram
         cmd |= 0b00000000 # increment on
         self.client.emulated_upd_send_command([cmd])
-        # make unique data for every byte of every character
-        data = [] # groups of 7 bytes, one for each character
-        for charnum in range(16):
-            offset = charnum * 7
-            data.append(bytearray(range(offset, offset+7)))
-        # write character data in groups of 2 characters per command
+        # write unique data for every byte of every character
+        # in groups of 2 characters per command
+        data = UPD_CHARGEN_RAM_DATA
         for charnum in range(0, 16, 2):
             # address setting command
             cmd = 0b10000000
             cmd |= charnum # address
+            offset = charnum * 7
             self.client.emulated_upd_send_command(
-                bytearray([cmd]) + data[charnum] + data[charnum+1]
+                bytearray([cmd]) + data[offset:offset+14]
                 )
         # verify all chargen ram data
         state = self.client.emulated_upd_dump_state()
         self.assertEqual(state.ram_area, avrclient.UPD_RAM_CHARGEN)
         self.assertTrue(state.increment)
         self.assertEqual(state.address, 0) # wrapped around
-        flattened_data = bytearray(itertools.chain.from_iterable(data))
-        self.assertEqual(state.chargen_ram, flattened_data)
+        self.assertEqual(state.chargen_ram, data)
 
     def test_upd_writing_chargen_ram_ignores_increment_off_writes_data(self):
         self.client.emulated_upd_reset()
@@ -536,60 +579,40 @@ class TestAvr(BaseTestCase):
         cmd |= 0b00000010 # chargen ram
         cmd |= 0b00001000 # increment off (ignored)
         self.client.emulated_upd_send_command([cmd])
-        # make unique data for every byte of every character
-        data = [] # groups of 7 bytes, one for each character
-        for charnum in range(16):
-            offset = charnum * 7
-            data.append(bytearray(range(offset, offset+7)))
-        # write character data in groups of 2 characters per command
+        # write unique data for every byte of every character
+        # in groups of 2 characters per command
+        data = UPD_CHARGEN_RAM_DATA
         for charnum in range(0, 16, 2):
             # address setting command
             cmd = 0b10000000
             cmd |= charnum # address
+            offset = charnum * 7
             self.client.emulated_upd_send_command(
-                bytearray([cmd]) + data[charnum] + data[charnum+1]
+                bytearray([cmd]) + data[offset:offset+14]
                 )
         # verify all chargen ram data
         state = self.client.emulated_upd_dump_state()
         self.assertEqual(state.ram_area, avrclient.UPD_RAM_CHARGEN)
         self.assertTrue(state.increment) # should ignore increment off
         self.assertEqual(state.address, 0) # wrapped around
-        flattened_data = bytearray(itertools.chain.from_iterable(data))
-        self.assertEqual(state.chargen_ram, flattened_data)
+        self.assertEqual(state.chargen_ram, data)
 
     def test_upd_writing_led_ram_increment_on_writes_data(self):
-        self.client.emulated_upd_reset()
-        # data setting command
-        cmd  = 0b01000000 # data setting command
-        cmd |= 0b00000011 # led output latch
-        cmd |= 0b00000000 # increment on
-        self.client.emulated_upd_send_command([cmd])
-        # address setting command
-        # followed a byte for the led output latch
-        cmd = 0b10000000
-        cmd |= 0 # address 0
+        ram_select_bits = 0b00000011 # led output latch
+        # a byte for the led output latch
         data = bytearray([42])
-        self.client.emulated_upd_send_command(bytearray([cmd]) + data)
-        state = self.client.emulated_upd_dump_state()
+        state = self._prepare_upd_ram(ram_select_bits, address=0, data=data)
         self.assertEqual(state.ram_area, avrclient.UPD_RAM_LED)
         self.assertTrue(state.increment)
         self.assertEqual(state.address, 0) # wrapped around
         self.assertEqual(state.led_ram, data)
 
     def test_upd_writing_led_ram_ignores_increment_off_writes_data(self):
-        self.client.emulated_upd_reset()
-        # data setting command
-        cmd  = 0b01000000 # data setting command
-        cmd |= 0b00000011 # led output latch
-        cmd |= 0b00001000 # increment off (ignored)
-        self.client.emulated_upd_send_command([cmd])
-        # address setting command
-        # followed a byte for the led output latch
-        cmd = 0b10000000
-        cmd |= 0 # address 0
+        ram_select_bits = 0b00000011 # led output latch
+        # a byte for the led output latch
         data = bytearray([42])
-        self.client.emulated_upd_send_command(bytearray([cmd]) + data)
-        state = self.client.emulated_upd_dump_state()
+        state = self._prepare_upd_ram(ram_select_bits, increment_off=True,
+                                      address=0, data=data)
         self.assertEqual(state.ram_area, avrclient.UPD_RAM_LED)
         self.assertTrue(state.increment) # should ignore increment off
         self.assertEqual(state.address, 0) # wrapped around
@@ -598,156 +621,164 @@ class TestAvr(BaseTestCase):
     # uPD16432B Emulator: Dirty RAM Tracking
 
     def test_upd_writing_display_ram_same_value_doesnt_set_dirty(self):
-        self.client.emulated_upd_reset()
-        state = self.client.emulated_upd_dump_state()
-        self.assertEqual(state.dirty_flags & avrclient.UPD_DIRTY_DISPLAY, 0)
-        self.assertEqual(state.display_ram[0], 0)
-        # send data setting command
-        cmd  = 0b01000000 # data setting command
-        cmd |= 0b00000000 # display ram
-        cmd |= 0b00001000 # increment off
-        self.client.emulated_upd_send_command([cmd])
-        # send address setting command followed by same value
-        cmd = 0b10000000
-        cmd |= 0 # address 0
-        self.client.emulated_upd_send_command([cmd, 0])
-        # dirty flag should still be false
-        state = self.client.emulated_upd_dump_state()
-        self.assertEqual(state.dirty_flags & avrclient.UPD_DIRTY_DISPLAY, 0)
+        with self.client.pipeline():
+            self.client.emulated_upd_reset()
+            state = self.client.emulated_upd_dump_state()
+            self.assertEqual(state.dirty_flags & avrclient.UPD_DIRTY_DISPLAY, 0)
+            self.assertEqual(state.display_ram[0], 0)
+            # send data setting command
+            cmd  = 0b01000000 # data setting command
+            cmd |= 0b00000000 # display ram
+            cmd |= 0b00001000 # increment off
+            self.client.emulated_upd_send_command([cmd])
+            # send address setting command followed by same value
+            cmd = 0b10000000
+            cmd |= 0 # address 0
+            self.client.emulated_upd_send_command([cmd, 0])
+            # dirty flag should still be false
+            state = self.client.emulated_upd_dump_state()
+            self.assertEqual(state.dirty_flags & avrclient.UPD_DIRTY_DISPLAY, 0)
 
     def test_upd_writing_display_ram_new_value_sets_dirty(self):
-        self.client.emulated_upd_reset()
-        state = self.client.emulated_upd_dump_state()
-        self.assertEqual(state.dirty_flags & avrclient.UPD_DIRTY_DISPLAY, 0)
-        self.assertEqual(state.display_ram[0], 0)
-        # send data setting command
-        cmd  = 0b01000000 # data setting command
-        cmd |= 0b00000000 # display ram
-        cmd |= 0b00001000 # increment off
-        self.client.emulated_upd_send_command([cmd])
-        # send address setting command followed by same value
-        cmd = 0b10000000
-        cmd |= 0 # address 0
-        self.client.emulated_upd_send_command([cmd, 1])
-        # dirty flag should be true
-        state = self.client.emulated_upd_dump_state()
-        self.assertEqual(state.display_ram[0], 1)
-        self.assertEqual(state.dirty_flags & avrclient.UPD_DIRTY_DISPLAY,
-            avrclient.UPD_DIRTY_DISPLAY)
+        with self.client.pipeline():
+            self.client.emulated_upd_reset()
+            state = self.client.emulated_upd_dump_state()
+            self.assertEqual(state.dirty_flags & avrclient.UPD_DIRTY_DISPLAY, 0)
+            self.assertEqual(state.display_ram[0], 0)
+            # send data setting command
+            cmd  = 0b01000000 # data setting command
+            cmd |= 0b00000000 # display ram
+            cmd |= 0b00001000 # increment off
+            self.client.emulated_upd_send_command([cmd])
+            # send address setting command followed by same value
+            cmd = 0b10000000
+            cmd |= 0 # address 0
+            self.client.emulated_upd_send_command([cmd, 1])
+            # dirty flag should be true
+            state = self.client.emulated_upd_dump_state()
+            self.assertEqual(state.display_ram[0], 1)
+            self.assertEqual(state.dirty_flags & avrclient.UPD_DIRTY_DISPLAY,
+                avrclient.UPD_DIRTY_DISPLAY)
 
     def test_upd_writing_pictograph_ram_same_value_doesnt_set_dirty(self):
-        self.client.emulated_upd_reset()
-        state = self.client.emulated_upd_dump_state()
-        self.assertEqual(state.dirty_flags & avrclient.UPD_DIRTY_PICTOGRAPH, 0)
-        self.assertEqual(state.pictograph_ram[0], 0)
-        # send data setting command
-        cmd  = 0b01000000 # data setting command
-        cmd |= 0b00000001 # pictograph ram
-        cmd |= 0b00001000 # increment off
-        self.client.emulated_upd_send_command([cmd])
-        # send address setting command followed by same value
-        cmd = 0b10000000
-        cmd |= 0 # address 0
-        self.client.emulated_upd_send_command([cmd, 0])
-        # dirty flag should still be false
-        state = self.client.emulated_upd_dump_state()
-        self.assertEqual(state.dirty_flags & avrclient.UPD_DIRTY_PICTOGRAPH, 0)
+        with self.client.pipeline():
+            self.client.emulated_upd_reset()
+            state = self.client.emulated_upd_dump_state()
+            self.assertEqual(state.dirty_flags & avrclient.UPD_DIRTY_PICTOGRAPH, 0)
+            self.assertEqual(state.pictograph_ram[0], 0)
+            # send data setting command
+            cmd  = 0b01000000 # data setting command
+            cmd |= 0b00000001 # pictograph ram
+            cmd |= 0b00001000 # increment off
+            self.client.emulated_upd_send_command([cmd])
+            # send address setting command followed by same value
+            cmd = 0b10000000
+            cmd |= 0 # address 0
+            self.client.emulated_upd_send_command([cmd, 0])
+            # dirty flag should still be false
+            state = self.client.emulated_upd_dump_state()
+            self.assertEqual(state.dirty_flags & avrclient.UPD_DIRTY_PICTOGRAPH, 0)
 
     def test_upd_writing_pictograph_ram_new_value_sets_dirty(self):
-        self.client.emulated_upd_reset()
-        state = self.client.emulated_upd_dump_state()
-        self.assertEqual(state.dirty_flags & avrclient.UPD_DIRTY_PICTOGRAPH, 0)
-        self.assertEqual(state.pictograph_ram[0], 0)
-        # send data setting command
-        cmd  = 0b01000000 # data setting command
-        cmd |= 0b00000001 # pictograph ram
-        cmd |= 0b00001000 # increment off
-        self.client.emulated_upd_send_command([cmd])
-        # send address setting command followed by same value
-        cmd = 0b10000000
-        cmd |= 0 # address 0
-        self.client.emulated_upd_send_command([cmd, 1])
-        # dirty flag should be true
-        state = self.client.emulated_upd_dump_state()
-        self.assertEqual(state.pictograph_ram[0], 1)
-        self.assertEqual(state.dirty_flags & avrclient.UPD_DIRTY_PICTOGRAPH,
-            avrclient.UPD_DIRTY_PICTOGRAPH)
+        with self.client.pipeline():
+            self.client.emulated_upd_reset()
+            state = self.client.emulated_upd_dump_state()
+            self.assertEqual(state.dirty_flags & avrclient.UPD_DIRTY_PICTOGRAPH, 0)
+            self.assertEqual(state.pictograph_ram[0], 0)
+            # send data setting command
+            cmd  = 0b01000000 # data setting command
+            cmd |= 0b00000001 # pictograph ram
+            cmd |= 0b00001000 # increment off
+            self.client.emulated_upd_send_command([cmd])
+            # send address setting command followed by same value
+            cmd = 0b10000000
+            cmd |= 0 # address 0
+            self.client.emulated_upd_send_command([cmd, 1])
+            # dirty flag should be true
+            state = self.client.emulated_upd_dump_state()
+            self.assertEqual(state.pictograph_ram[0], 1)
+            self.assertEqual(state.dirty_flags & avrclient.UPD_DIRTY_PICTOGRAPH,
+                avrclient.UPD_DIRTY_PICTOGRAPH)
 
     def test_upd_writing_chargen_ram_same_value_doesnt_set_dirty(self):
-        self.client.emulated_upd_reset()
-        state = self.client.emulated_upd_dump_state()
-        self.assertEqual(state.dirty_flags & avrclient.UPD_DIRTY_CHARGEN, 0)
-        self.assertEqual(state.chargen_ram[0], 0)
-        # send data setting command
-        cmd  = 0b01000000 # data setting command
-        cmd |= 0b00000010 # chargen ram
-        cmd |= 0b00001000 # increment off
-        self.client.emulated_upd_send_command([cmd])
-        # send address setting command followed by same value
-        cmd = 0b10000000
-        cmd |= 0 # address 0
-        self.client.emulated_upd_send_command([cmd, 0])
-        # dirty flag should still be false
-        state = self.client.emulated_upd_dump_state()
-        self.assertEqual(state.dirty_flags & avrclient.UPD_DIRTY_CHARGEN, 0)
+        with self.client.pipeline():
+            self.client.emulated_upd_reset()
+            state = self.client.emulated_upd_dump_state()
+            self.assertEqual(state.dirty_flags & avrclient.UPD_DIRTY_CHARGEN, 0)
+            self.assertEqual(state.chargen_ram[0], 0)
+            # send data setting command
+            cmd  = 0b01000000 # data setting command
+            cmd |= 0b00000010 # chargen ram
+            cmd |= 0b00001000 # increment off
+            self.client.emulated_upd_send_command([cmd])
+            # send address setting command followed by same value
+            cmd = 0b10000000
+            cmd |= 0 # address 0
+            self.client.emulated_upd_send_command([cmd, 0])
+            # dirty flag should still be false
+            state = self.client.emulated_upd_dump_state()
+            self.assertEqual(state.dirty_flags & avrclient.UPD_DIRTY_CHARGEN, 0)
 
     def test_upd_writing_chargen_ram_new_value_sets_dirty(self):
-        self.client.emulated_upd_reset()
-        state = self.client.emulated_upd_dump_state()
-        self.assertEqual(state.dirty_flags & avrclient.UPD_DIRTY_CHARGEN, 0)
-        self.assertEqual(state.chargen_ram[0], 0)
-        # send data setting command
-        cmd  = 0b01000000 # data setting command
-        cmd |= 0b00000010 # chargen ram
-        cmd |= 0b00001000 # increment off
-        self.client.emulated_upd_send_command([cmd])
-        # send address setting command followed by same value
-        cmd = 0b10000000
-        cmd |= 0 # address 0
-        self.client.emulated_upd_send_command([cmd, 1])
-        # dirty flag should be true
-        state = self.client.emulated_upd_dump_state()
-        self.assertEqual(state.chargen_ram[0], 1)
-        self.assertEqual(state.dirty_flags & avrclient.UPD_DIRTY_CHARGEN,
-            avrclient.UPD_DIRTY_CHARGEN)
+        with self.client.pipeline():
+            self.client.emulated_upd_reset()
+            state = self.client.emulated_upd_dump_state()
+            self.assertEqual(state.dirty_flags & avrclient.UPD_DIRTY_CHARGEN, 0)
+            self.assertEqual(state.chargen_ram[0], 0)
+            # send data setting command
+            cmd  = 0b01000000 # data setting command
+            cmd |= 0b00000010 # chargen ram
+            cmd |= 0b00001000 # increment off
+            self.client.emulated_upd_send_command([cmd])
+            # send address setting command followed by same value
+            cmd = 0b10000000
+            cmd |= 0 # address 0
+            self.client.emulated_upd_send_command([cmd, 1])
+            # dirty flag should be true
+            state = self.client.emulated_upd_dump_state()
+            self.assertEqual(state.chargen_ram[0], 1)
+            self.assertEqual(state.dirty_flags & avrclient.UPD_DIRTY_CHARGEN,
+                avrclient.UPD_DIRTY_CHARGEN)
 
     def test_upd_writing_led_ram_same_value_doesnt_set_dirty(self):
-        self.client.emulated_upd_reset()
-        state = self.client.emulated_upd_dump_state()
-        self.assertEqual(state.dirty_flags & avrclient.UPD_DIRTY_LED, 0)
-        self.assertEqual(state.led_ram[0], 0)
-        # send data setting command
-        cmd  = 0b01000000 # data setting command
-        cmd |= 0b00000011 # led output latch
-        cmd |= 0b00001000 # increment off
-        self.client.emulated_upd_send_command([cmd])
-        # send address setting command followed by same value
-        cmd = 0b10000000
-        cmd |= 0 # address 0
-        self.client.emulated_upd_send_command([cmd, 0])
-        # dirty flag should still be false
-        state = self.client.emulated_upd_dump_state()
-        self.assertEqual(state.dirty_flags & avrclient.UPD_DIRTY_LED, 0)
+        with self.client.pipeline():
+            self.client.emulated_upd_reset()
+            state = self.client.emulated_upd_dump_state()
+            self.assertEqual(state.dirty_flags & avrclient.UPD_DIRTY_LED, 0)
+            self.assertEqual(state.led_ram[0], 0)
+            # send data setting command
+            cmd  = 0b01000000 # data setting command
+            cmd |= 0b00000011 # led output latch
+            cmd |= 0b00001000 # increment off
+            self.client.emulated_upd_send_command([cmd])
+            # send address setting command followed by same value
+            cmd = 0b10000000
+            cmd |= 0 # address 0
+            self.client.emulated_upd_send_command([cmd, 0])
+            # dirty flag should still be false
+            state = self.client.emulated_upd_dump_state()
+            self.assertEqual(state.dirty_flags & avrclient.UPD_DIRTY_LED, 0)
 
     def test_upd_writing_led_ram_new_value_sets_dirty(self):
-        self.client.emulated_upd_reset()
-        state = self.client.emulated_upd_dump_state()
-        self.assertEqual(state.dirty_flags & avrclient.UPD_DIRTY_LED, 0)
-        self.assertEqual(state.led_ram[0], 0)
-        # send data setting command
-        cmd  = 0b01000000 # data setting command
-        cmd |= 0b00000011 # led output latch
-        cmd |= 0b00001000 # increment off
-        self.client.emulated_upd_send_command([cmd])
-        # send address setting command followed by same value
-        cmd = 0b10000000
-        cmd |= 0 # address 0
-        self.client.emulated_upd_send_command([cmd, 1])
-        # dirty flag should be true
-        state = self.client.emulated_upd_dump_state()
-        self.assertEqual(state.led_ram[0], 1)
-        self.assertEqual(state.dirty_flags & avrclient.UPD_DIRTY_LED,
-            avrclient.UPD_DIRTY_LED)
+        with self.client.pipeline():
+            self.client.emulated_upd_reset()
+            state = self.client.emulated_upd_dump_state()
+            self.assertEqual(state.dirty_flags & avrclient.UPD_DIRTY_LED, 0)
+            self.assertEqual(state.led_ram[0], 0)
+            # send data setting command
+            cmd  = 0b01000000 # data setting command
+            cmd |= 0b00000011 # led output latch
+            cmd |= 0b00001000 # increment off
+            self.client.emulated_upd_send_command([cmd])
+            # send address setting command followed by same value
+            cmd = 0b10000000
+            cmd |= 0 # address 0
+            self.client.emulated_upd_send_command([cmd, 1])
+            # dirty flag should be true
+            state = self.client.emulated_upd_dump_state()
+            self.assertEqual(state.led_ram[0], 1)
+            self.assertEqual(state.dirty_flags & avrclient.UPD_DIRTY_LED,
+                avrclient.UPD_DIRTY_LED)
 
     # Faceplate
 
@@ -805,6 +836,22 @@ class TestAvr(BaseTestCase):
 
     # Radio State
 
+    def _reset_radio_state(self, *displays):
+        '''Reset the radio state, parse each of the setup displays in order,
+        and return the state dump.  The commands are pipelined so setting
+        up a known state takes one round trip.'''
+        with self.client.pipeline():
+            self.client.radio_state_reset()
+            for display in displays:
+                self.client.radio_state_parse(display)
+            return self.client.radio_state_dump()
+
+    def _parse_radio_state(self, display):
+        '''Parse a display and return the state dump in one round trip.'''
+        with self.client.pipeline():
+            self.client.radio_state_parse(display)
+            return self.client.radio_state_dump()
+
     def test_radio_state_returns_error_for_too_few_display_data_bytes(self):
         rx_bytes = self.client.command(
             data=[avrclient.CMD_RADIO_STATE_PARSE] + ([0] * 10),
@@ -822,247 +869,89 @@ class TestAvr(BaseTestCase):
         self.assertEqual(len(rx_bytes), 1)
 
     def test_radio_state_safe_mode(self):
-        values = (
-            # Premium 4
-            (b"     0000  ",    0, 0, OperationModes.SAFE_ENTRY),
-            (b"1    1234  ", 1234, 1, OperationModes.SAFE_ENTRY),
-            (b"2    5678  ", 5678, 2, OperationModes.SAFE_ENTRY),
-            (b"9    9999  ", 9999, 9, OperationModes.SAFE_ENTRY),
-            (b"    NO CODE",    0, 0, OperationModes.SAFE_NO_CODE),
-            # Premium 5
-            (b"    0000   ",    0, 0, OperationModes.SAFE_ENTRY),
-            (b"1   1234   ", 1234, 1, OperationModes.SAFE_ENTRY),
-            (b"2   5678   ", 5678, 2, OperationModes.SAFE_ENTRY),
-            (b"9   9999   ", 9999, 9, OperationModes.SAFE_ENTRY),
-            # Premium 4 and 5
-            (b"     SAFE  ", 1000, 0, OperationModes.SAFE_LOCKED),
-            (b"1    SAFE  ", 1000, 1, OperationModes.SAFE_LOCKED),
-            (b"2    SAFE  ", 1000, 2, OperationModes.SAFE_LOCKED),
-            (b"9    SAFE  ", 1000, 9, OperationModes.SAFE_LOCKED),
-        )
-        for display, safe_code, safe_tries, mode in values:
-            self.client.radio_state_reset()
-            self.client.radio_state_parse(display)
-            state = self.client.radio_state_dump()
-            self.assertEqual(state.safe_code, safe_code)
-            self.assertEqual(state.safe_tries, safe_tries)
-            self.assertEqual(state.operation_mode, mode)
-            self.assertEqual(state.display_mode,
-                DisplayModes.SHOWING_OPERATION)
+        for display, safe_code, safe_tries, mode in RADIO_SAFE_MODE_DISPLAYS:
+            with self._subtest(display=display):
+                state = self._reset_radio_state(display)
+                self.assertEqual(state.safe_code, safe_code)
+                self.assertEqual(state.safe_tries, safe_tries)
+                self.assertEqual(state.operation_mode, mode)
+                self.assertEqual(state.display_mode,
+                    DisplayModes.SHOWING_OPERATION)
 
     def test_initial(self):
-        self.client.radio_state_reset()
         # set up known values
-        self.client.radio_state_parse(b"FM161079MHZ")
-        self.client.radio_state_parse(b"FM1   MIN  ")
-        state = self.client.radio_state_dump()
+        state = self._reset_radio_state(b"FM161079MHZ", b"FM1   MIN  ")
         self.assertEqual(state.operation_mode,
             OperationModes.TUNER_PLAYING)
         self.assertEqual(state.display_mode,
             DisplayModes.ADJUSTING_SOUND_VOLUME)
         # parse display
-        self.client.radio_state_parse(b"    INITIAL")
-        state = self.client.radio_state_dump()
+        state = self._parse_radio_state(b"    INITIAL")
         self.assertEqual(state.operation_mode,
             OperationModes.INITIALIZING)
         self.assertEqual(state.display_mode,
             DisplayModes.SHOWING_OPERATION)
 
     def test_monsoon_premium_5(self):
-        self.client.radio_state_reset()
         # set up known values
-        self.client.radio_state_parse(b"FM161079MHZ")
-        self.client.radio_state_parse(b"FM1   MIN  ")
-        state = self.client.radio_state_dump()
+        state = self._reset_radio_state(b"FM161079MHZ", b"FM1   MIN  ")
         self.assertEqual(state.operation_mode,
             OperationModes.TUNER_PLAYING)
         self.assertEqual(state.display_mode,
             DisplayModes.ADJUSTING_SOUND_VOLUME)
         # parse display
-        self.client.radio_state_parse(b"    MONSOON")
-        state = self.client.radio_state_dump()
+        state = self._parse_radio_state(b"    MONSOON")
         self.assertEqual(state.operation_mode,
             OperationModes.MONSOON)
         self.assertEqual(state.display_mode,
             DisplayModes.SHOWING_OPERATION)
 
     def test_diag(self):
-        self.client.radio_state_reset()
         # set up known values
-        self.client.radio_state_parse(b"FM161079MHZ")
-        self.client.radio_state_parse(b"FM1   MIN  ")
-        state = self.client.radio_state_dump()
+        state = self._reset_radio_state(b"FM161079MHZ", b"FM1   MIN  ")
         self.assertEqual(state.operation_mode,
             OperationModes.TUNER_PLAYING)
         self.assertEqual(state.display_mode,
             DisplayModes.ADJUSTING_SOUND_VOLUME)
         # parse display
-        self.client.radio_state_parse(b"     DIAG  ")
-        state = self.client.radio_state_dump()
+        state = self._parse_radio_state(b"     DIAG  ")
         self.assertEqual(state.operation_mode,
             OperationModes.DIAGNOSTICS)
         self.assertEqual(state.display_mode,
             DisplayModes.SHOWING_OPERATION)
 
     def test_radio_state_sound_volume(self):
-        displays = (
-            b"AM    MIN  ",
-            b"AM    MAX  ",
-            b"FM1   MIN  ",
-            b"FM1   MAX  ",
-            b"FM2   MIN  ",
-            b"FM2   MAX  ",
-            b"CD    MIN  ",
-            b"CD    MAX  ",
-            b"TAP   MIN  ",
-            b"TAP   MAX  ",
-        )
-        for display in displays:
-            # set up known values
-            self.client.radio_state_reset()
-            self.client.radio_state_parse(b"FM161079MHZ")
-            state = self.client.radio_state_dump()
-            self.assertEqual(state.operation_mode,
-                OperationModes.TUNER_PLAYING)
-            self.assertEqual(state.display_mode,
-                DisplayModes.SHOWING_OPERATION)
-            # parse display
-            self.client.radio_state_parse(display)
-            state = self.client.radio_state_dump()
-            self.assertEqual(state.operation_mode,
-                OperationModes.TUNER_PLAYING)
-            self.assertEqual(state.display_mode,
-                DisplayModes.ADJUSTING_SOUND_VOLUME)
-
-    def test_radio_state_sound_balance(self):
-        values = (
-            (b"BAL LEFT  9", -9),
-            (b"BAL LEFT  1", -1),
-            (b"BAL CENTER ", 0),
-            (b"BAL RIGHT 1", 1),
-            (b"BAL RIGHT 9", 9),
-        )
-        for display, balance in values:
-            # set up known values
-            self.client.radio_state_reset()
-            self.client.radio_state_parse(b"FM161079MHZ")
-            state = self.client.radio_state_dump()
-            self.assertEqual(state.operation_mode,
-                OperationModes.TUNER_PLAYING)
-            self.assertEqual(state.display_mode,
-                DisplayModes.SHOWING_OPERATION)
-            # parse display
-            self.client.radio_state_parse(display)
-            state = self.client.radio_state_dump()
-            self.assertEqual(state.operation_mode,
-                OperationModes.TUNER_PLAYING)
-            self.assertEqual(state.display_mode,
-                DisplayModes.ADJUSTING_SOUND_BALANCE)
-            self.assertEqual(state.sound_balance, balance)
-
-    def test_radio_state_sound_fade(self):
-        values = (
-            (b"FADEREAR  9", -9),
-            (b"FADEREAR  1", -1),
-            (b"FADECENTER ", 0),
-            (b"FADEFRONT 1", 1),
-            (b"FADEFRONT 9", 9),
-        )
-        for display, fade in values:
-            # set up known values
-            self.client.radio_state_reset()
-            self.client.radio_state_parse(b"FM161079MHZ")
-            state = self.client.radio_state_dump()
-            self.assertEqual(state.operation_mode,
-                OperationModes.TUNER_PLAYING)
-            self.assertEqual(state.display_mode,
-                DisplayModes.SHOWING_OPERATION)
-            # parse display
-            self.client.radio_state_parse(display)
-            state = self.client.radio_state_dump()
-            self.assertEqual(state.operation_mode,
-                OperationModes.TUNER_PLAYING)
-            self.assertEqual(state.display_mode,
-                DisplayModes.ADJUSTING_SOUND_FADE)
-            self.assertEqual(state.sound_fade, fade)
-
-    def test_radio_state_sound_bass(self):
-        values = (
-            (b"BASS  - 9  ", -9),
-            (b"BASS  - 1  ", -1),
-            (b"BASS    0  ", 0),
-            (b"BASS  + 1  ", 1),
-            (b"BASS  + 9  ", 9),
-        )
-        for display, bass in values:
-            # set up known values
-            self.client.radio_state_reset()
-            self.client.radio_state_parse(b"FM161079MHZ")
-            state = self.client.radio_state_dump()
-            self.assertEqual(state.operation_mode,
-                OperationModes.TUNER_PLAYING)
-            self.assertEqual(state.display_mode,
-                DisplayModes.SHOWING_OPERATION)
-            # parse display
-            self.client.radio_state_parse(display)
-            state = self.client.radio_state_dump()
-            self.assertEqual(state.operation_mode,
-                OperationModes.TUNER_PLAYING)
-            self.assertEqual(state.display_mode,
-                DisplayModes.ADJUSTING_SOUND_BASS)
-            self.assertEqual(state.sound_bass, bass)
-
-    def test_radio_state_sound_treble(self):
-        values = (
-            (b"TREB  - 9  ", -9),
-            (b"TREB  - 1  ", -1),
-            (b"TREB    0  ", 0),
-            (b"TREB  + 1  ", 1),
-            (b"TREB  + 9  ", 9),
-        )
-        for display, treble in values:
-            # set up known values
-            self.client.radio_state_reset()
-            self.client.radio_state_parse(b"FM161079MHZ")
-            state = self.client.radio_state_dump()
-            self.assertEqual(state.operation_mode,
-                OperationModes.TUNER_PLAYING)
-            self.assertEqual(state.display_mode,
-                DisplayModes.SHOWING_OPERATION)
-            # parse display
-            self.client.radio_state_parse(display)
-            state = self.client.radio_state_dump()
-            self.assertEqual(state.operation_mode,
-                OperationModes.TUNER_PLAYING)
-            self.assertEqual(state.display_mode,
-                DisplayModes.ADJUSTING_SOUND_TREBLE)
-            self.assertEqual(state.sound_treble, treble)
-
-    def test_radio_state_sound_midrange_premium_5(self):
-        values = (
-            (b"MID   - 9  ", -9),
-            (b"MID   - 1  ", -1),
-            (b"MID     0  ", 0),
-            (b"MID   + 1  ", 1),
-            (b"MID   + 9  ", 9),
-        )
-        for display, mid in values:
-            # set up known values
-            self.client.radio_state_reset()
-            self.client.radio_state_parse(b"FM161079MHZ")
-            state = self.client.radio_state_dump()
-            self.assertEqual(state.operation_mode,
-                OperationModes.TUNER_PLAYING)
-            self.assertEqual(state.display_mode,
-                DisplayModes.SHOWING_OPERATION)
-            # parse display
-            self.client.radio_state_parse(display)
-            state = self.client.radio_state_dump()
-            self.assertEqual(state.operation_mode,
-                OperationModes.TUNER_PLAYING)
-            self.assertEqual(state.display_mode,
-                DisplayModes.ADJUSTING_SOUND_MIDRANGE)
-            self.assertEqual(state.sound_midrange, mid)
+        # set up known values
+        state = self._reset_radio_state(b"FM161079MHZ")
+        self.assertEqual(state.operation_mode,
+            OperationModes.TUNER_PLAYING)
+        self.assertEqual(state.display_mode,
+            DisplayModes.SHOWING_OPERATION)
+        for display in RADIO_SOUND_VOLUME_DISPLAYS:
+            with self._subtest(display=display):
+                # parse display from the same known values
+                state = self._reset_radio_state(b"FM161079MHZ", display)
+                self.assertEqual(state.operation_mode,
+                    OperationModes.TUNER_PLAYING)
+                self.assertEqual(state.display_mode,
+                    DisplayModes.ADJUSTING_SOUND_VOLUME)
+
+    def test_radio_state_sound_adjustments(self):
+        # set up known values
+        state = self._reset_radio_state(b"FM161079MHZ")
+        self.assertEqual(state.operation_mode,
+            OperationModes.TUNER_PLAYING)
+        self.assertEqual(state.display_mode,
+            DisplayModes.SHOWING_OPERATION)
+        for display_mode, attr, values in RADIO_SOUND_ADJUSTMENTS:
+            for display, value in values:
+                with self._subtest(display=display):
+                    # parse display from the same known values
+                    state = self._reset_radio_state(b"FM161079MHZ", display)
+                    self.assertEqual(state.operation_mode,
+                        OperationModes.TUNER_PLAYING)
+                    self.assertEqual(state.display_mode, display_mode)
+                    self.assertEqual(getattr(state, attr), value)
 
     def test_radio_state_set_option_on_vol(self):
         values = (
@@ -1073,96 +962,88 @@ class TestAvr(BaseTestCase):
             (b"SET ONVOL63", 63),
             (b"SET ONVOL99", 99),
         )
+        # set up known values
+        state = self._reset_radio_state(b"FM161079MHZ", b"FM1   MIN  ")
+        self.assertEqual(state.operation_mode,
+            OperationModes.TUNER_PLAYING)
+        self.assertEqual(state.display_mode,
+            DisplayModes.ADJUSTING_SOUND_VOLUME)
         for display, on_vol in values:
-            # set up known values
-            self.client.radio_state_reset()
-            self.client.radio_state_parse(b"FM161079MHZ")
-            self.client.radio_state_parse(b"FM1   MIN  ")
-            state = self.client.radio_state_dump()
-            self.assertEqual(state.operation_mode,
-                OperationModes.TUNER_PLAYING)
-            self.assertEqual(state.display_mode,
-                DisplayModes.ADJUSTING_SOUND_VOLUME)
-            # parse display
-            self.client.radio_state_parse(display)
-            state = self.client.radio_state_dump()
-            self.assertEqual(state.option_on_vol, on_vol)
-            self.assertEqual(state.operation_mode,
-                OperationModes.SETTING_ON_VOL)
-            self.assertEqual(state.display_mode,
-                DisplayModes.SHOWING_OPERATION)
+            with self._subtest(display=display):
+                # parse display from the same known values
+                state = self._reset_radio_state(
+                    b"FM161079MHZ", b"FM1   MIN  ", display)
+                self.assertEqual(state.option_on_vol, on_vol)
+                self.assertEqual(state.operation_mode,
+                    OperationModes.SETTING_ON_VOL)
+                self.assertEqual(state.display_mode,
+                    DisplayModes.SHOWING_OPERATION)
 
     def test_radio_state_set_option_cd_mix(self):
         values = (
             (b"SET CD MIX1", 1),
             (b"SET CD MIX6", 6),
         )
+        # set up known values
+        state = self._reset_radio_state(b"FM161079MHZ", b"FM1   MIN  ")
+        self.assertEqual(state.operation_mode,
+            OperationModes.TUNER_PLAYING)
+        self.assertEqual(state.display_mode,
+            DisplayModes.ADJUSTING_SOUND_VOLUME)
         for display, cd_mix in values:
-            # set up known values
-            self.client.radio_state_reset()
-            self.client.radio_state_parse(b"FM161079MHZ")
-            self.client.radio_state_parse(b"FM1   MIN  ")
-            state = self.client.radio_state_dump()
-            self.assertEqual(state.operation_mode,
-                OperationModes.TUNER_PLAYING)
-            self.assertEqual(state.display_mode,
-                DisplayModes.ADJUSTING_SOUND_VOLUME)
-            # parse display
-            self.client.radio_state_parse(display)
-            state = self.client.radio_state_dump()
-            self.assertEqual(state.option_cd_mix, cd_mix)
-            self.assertEqual(state.operation_mode,
-                OperationModes.SETTING_CD_MIX)
-            self.assertEqual(state.display_mode,
-                DisplayModes.SHOWING_OPERATION)
+            with self._subtest(display=display):
+                # parse display from the same known values
+                state = self._reset_radio_state(
+                    b"FM161079MHZ", b"FM1   MIN  ", display)
+                self.assertEqual(state.option_cd_mix, cd_mix)
+                self.assertEqual(state.operation_mode,
+                    OperationModes.SETTING_CD_MIX)
+                self.assertEqual(state.display_mode,
+                    DisplayModes.SHOWING_OPERATION)
 
     def test_radio_state_set_option_tape_skip(self):
         values = (
             (b"TAPE SKIP N", 0),
             (b"TAPE SKIP Y", 1),
         )
+        # set up known values
+        state = self._reset_radio_state(b"FM161079MHZ", b"FM1   MIN  ")
+        self.assertEqual(state.operation_mode,
+            OperationModes.TUNER_PLAYING)
+        self.assertEqual(state.display_mode,
+            DisplayModes.ADJUSTING_SOUND_VOLUME)
         for display, tape_skip in values:
-            # set up known values
-            self.client.radio_state_reset()
-            self.client.radio_state_parse(b"FM161079MHZ")
-            self.client.radio_state_parse(b"FM1   MIN  ")
-            state = self.client.radio_state_dump()
-            self.assertEqual(state.operation_mode,
-                OperationModes.TUNER_PLAYING)
-            self.assertEqual(state.display_mode,
-                DisplayModes.ADJUSTING_SOUND_VOLUME)
-            # parse display
-            self.client.radio_state_parse(display)
-            state = self.client.radio_state_dump()
-            self.assertEqual(state.option_tape_skip, tape_skip)
-            self.assertEqual(state.operation_mode,
-                OperationModes.SETTING_TAPE_SKIP)
-            self.assertEqual(state.display_mode,
-                DisplayModes.SHOWING_OPERATION)
+            with self._subtest(display=display):
+                # parse display from the same known values
+                state = self._reset_radio_state(
+                    b"FM161079MHZ", b"FM1   MIN  ", display)
+                self.assertEqual(state.option_tape_skip, tape_skip)
+                self.assertEqual(state.operation_mode,
+                    OperationModes.SETTING_TAPE_SKIP)
+                self.assertEqual(state.display_mode,
+                    DisplayModes.SHOWING_OPERATION)
 
     def test_test_fern(self):
         values = (
             (b"FERN   OFF ", 0),
             (b"FERN   ON  ", 1),
         )
+        # set up known values
+        state = self._reset_radio_state(b"FM161079MHZ", b"FM1   MIN  ")
+        self.assertEqual(state.operation_mode,
+            OperationModes.TUNER_PLAYING)
+        self.assertEqual(state.display_mode,
+            DisplayModes.ADJUSTING_SOUND_VOLUME)
         for display, fern in values:
-            # set up known values
-            self.client.radio_state_reset()
-            self.client.radio_state_parse(b"FM161079MHZ")
-            self.client.radio_state_parse(b"FM1   MIN  ")
-            state = self.client.radio_state_dump()
-            self.assertEqual(state.operation_mode,
-                OperationModes.TUNER_PLAYING)
-            self.assertEqual(state.display_mode,
-                DisplayModes.ADJUSTING_SOUND_VOLUME)
-            # parse display
-            self.client.radio_state_parse(display)
-            state = self.client.radio_state_dump()
-            self.assertEqual(state.test_fern, fern)
-            self.assertEqual(state.operation_mode,
-                OperationModes.TESTING_FERN)
-            self.assertEqual(state.display_mode,
-                DisplayModes.SHOWING_OPERATION)
+            with self._subtest(display=display):
+                # parse display from the same known values
+                state = self._reset_radio_state(
+                    b"FM161079MHZ", b"FM1   MIN  ", display)
+                self.assertEqual(state.test_fern, fern)
+                self.assertEqual(state.operation_mode,
+                    OperationModes.TESTING_FERN)
+                self.assertEqual(state.display_mode,
+                    DisplayModes.SHOWING_OPERATION)
 
     def test_test_rad(self):
         values = (
@@ -1170,24 +1051,22 @@ class TestAvr(BaseTestCase):
             (b"RAD   DE2  ", b"  DE2  "), # Premium 5
             (b"RAD 0123456", b"0123456"),
         )
+        # set up known values
+        state = self._reset_radio_state(b"FM161079MHZ", b"FM1   MIN  ")
+        self.assertEqual(state.operation_mode,
+            OperationModes.TUNER_PLAYING)
+        self.assertEqual(state.display_mode,
+            DisplayModes.ADJUSTING_SOUND_VOLUME)
         for display, rad in values:
-            # set up known values
-            self.client.radio_state_reset()
-            self.client.radio_state_parse(b"FM161079MHZ")
-            self.client.radio_state_parse(b"FM1   MIN  ")
-            state = self.client.radio_state_dump()
-            self.assertEqual(state.operation_mode,
-                OperationModes.TUNER_PLAYING)
-            self.assertEqual(state.display_mode,
-                DisplayModes.ADJUSTING_SOUND_VOLUME)
-            # parse display
-            self.client.radio_state_parse(display)
-            state = self.client.radio_state_dump()
-            self.assertEqual(state.test_rad, rad)
-            self.assertEqual(state.operation_mode,
-                OperationModes.TESTING_RAD)
-            self.assertEqual(state.display_mode,
-                DisplayModes.SHOWING_OPERATION)
+            with self._subtest(display=display):
+                # parse display from the same known values
+                state = self._reset_radio_state(
+                    b"FM161079MHZ", b"FM1   MIN  ", display)
+                self.assertEqual(state.test_rad, rad)
+                self.assertEqual(state.operation_mode,
+                    OperationModes.TESTING_RAD)
+                self.assertEqual(state.display_mode,
+                    DisplayModes.SHOWING_OPERATION)
 
     def test_test_ver(self):
         values = (
@@ -1195,24 +1074,22 @@ class TestAvr(BaseTestCase):
             (b"VersA99CZ23", b"A99CZ23"), # Premium 5
             (b"VER ABCDEFG", b"ABCDEFG"),
         )
+        # set up known values
+        state = self._reset_radio_state(b"FM161079MHZ", b"FM1   MIN  ")
+        self.assertEqual(state.operation_mode,
+            OperationModes.TUNER_PLAYING)
+        self.assertEqual(state.display_mode,
+            DisplayModes.ADJUSTING_SOUND_VOLUME)
         for display, ver in values:
-            # set up known values
-            self.client.radio_state_reset()
-            self.client.radio_state_parse(b"FM161079MHZ")
-            self.client.radio_state_parse(b"FM1   MIN  ")
-            state = self.client.radio_state_dump()
-            self.assertEqual(state.operation_mode,
-                OperationModes.TUNER_PLAYING)
-            self.assertEqual(state.display_mode,
-                DisplayModes.ADJUSTING_SOUND_VOLUME)
-            # parse display
-            self.client.radio_state_parse(display)
-            state = self.client.radio_state_dump()
-            self.assertEqual(state.test_ver, ver)
-            self.assertEqual(state.operation_mode,
-                OperationModes.TESTING_VER)
-            self.assertEqual(state.display_mode,
-                DisplayModes.SHOWING_OPERATION)
+            with self._subtest(display=display):
+                # parse display from the same known values
+                state = self._reset_radio_state(
+                    b"FM161079MHZ", b"FM1   MIN  ", display)
+                self.assertEqual(state.test_ver, ver)
+                self.assertEqual(state.operation_mode,
+                    OperationModes.TESTING_VER)
+                self.assertEqual(state.display_mode,
+                    DisplayModes.SHOWING_OPERATION)
 
     def test_test_signal_premium5(self):
         values = (
@@ -1225,25 +1102,23 @@ class TestAvr(BaseTestCase):
             (b"10770 0 0 0", 1077, 0x0000),
             (b"1077F F F F", 1077, 0xFFFF),
         )
+        # set up known values
+        state = self._reset_radio_state(b"FM161079MHZ", b"FM1   MIN  ")
+        self.assertEqual(state.operation_mode,
+            OperationModes.TUNER_PLAYING)
+        self.assertEqual(state.display_mode,
+            DisplayModes.ADJUSTING_SOUND_VOLUME)
         for display, freq, strength in values:
-            # set up known values
-            self.client.radio_state_reset()
-            self.client.radio_state_parse(b"FM161079MHZ")
-            self.client.radio_state_parse(b"FM1   MIN  ")
-            state = self.client.radio_state_dump()
-            self.assertEqual(state.operation_mode,
-                OperationModes.TUNER_PLAYING)
-            self.assertEqual(state.display_mode,
-                DisplayModes.ADJUSTING_SOUND_VOLUME)
-            # parse display
-            self.client.radio_state_parse(display)
-            state = self.client.radio_state_dump()
-            self.assertEqual(state.test_signal_freq, freq)
-            self.assertEqual(state.test_signal_strength, strength)
-            self.assertEqual(state.operation_mode,
-                OperationModes.TESTING_SIGNAL)
-            self.assertEqual(state.display_mode,
-                DisplayModes.SHOWING_OPERATION)
+            with self._subtest(display=display):
+                # parse display from the same known values
+                state = self._reset_radio_state(
+                    b"FM161079MHZ", b"FM1   MIN  ", display)
+                self.assertEqual(state.test_signal_freq, freq)
+                self.assertEqual(state.test_signal_strength, strength)
+                self.assertEqual(state.operation_mode,
+                    OperationModes.TESTING_SIGNAL)
+                self.assertEqual(state.display_mode,
+                    DisplayModes.SHOWING_OPERATION)
 
     def test_radio_state_cd_playing(self):
         values = (
@@ -1251,15 +1126,14 @@ class TestAvr(BaseTestCase):
             (b"CD 6 TR 99 ", 6, 99),
         )
         for display, disc, track in values:
-            self.client.radio_state_reset()
-            self.client.radio_state_parse(display)
-            state = self.client.radio_state_dump()
-            self.assertEqual(state.cd_disc, disc)
-            self.assertEqual(state.cd_track, track)
-            self.assertEqual(state.operation_mode,
-                OperationModes.CD_PLAYING)
-            self.assertEqual(state.display_mode,
-                DisplayModes.SHOWING_OPERATION)
+            with self._subtest(display=display):
+                state = self._reset_radio_state(display)
+                self.assertEqual(state.cd_disc, disc)
+                self.assertEqual(state.cd_track, track)
+                self.assertEqual(state.operation_mode,
+                    OperationModes.CD_PLAYING)
+                self.assertEqual(state.display_mode,
+                    DisplayModes.SHOWING_OPERATION)
 
     def test_cd_cue_rev_pos(self):
         values = (
@@ -1290,67 +1164,59 @@ class TestAvr(BaseTestCase):
             (b"CD 2 -002  ", OperationModes.CD_PLAYING, 2, 0),
             (b"CD 2-1234  ", OperationModes.CD_PLAYING, 2, 0),
         )
+        # set up known values
+        state = self._reset_radio_state(b"CD 5 TR 12 ")
+        self.assertEqual(state.cd_disc, 5)
+        self.assertEqual(state.cd_track, 12)
+        self.assertEqual(state.operation_mode,
+            OperationModes.CD_PLAYING)
         for display, operation_mode, cd_disc, cd_track_pos in values:
-            # set up known values
-            self.client.radio_state_reset()
-            self.client.radio_state_parse(b"CD 5 TR 12 ")
-            state = self.client.radio_state_dump()
-            self.assertEqual(state.cd_disc, 5)
-            self.assertEqual(state.cd_track, 12)
-            self.assertEqual(state.operation_mode,
-                OperationModes.CD_PLAYING)
-            # parse display
-            self.client.radio_state_parse(display)
-            state = self.client.radio_state_dump()
-            self.assertEqual(state.cd_disc, cd_disc)
-            self.assertEqual(state.cd_track, 12)
-            self.assertEqual(state.cd_track_pos, cd_track_pos)
-            self.assertEqual(state.operation_mode,
-                operation_mode)
-            self.assertEqual(state.display_mode,
-                DisplayModes.SHOWING_OPERATION)
+            with self._subtest(display=display):
+                # parse display from the same known values
+                state = self._reset_radio_state(b"CD 5 TR 12 ", display)
+                self.assertEqual(state.cd_disc, cd_disc)
+                self.assertEqual(state.cd_track, 12)
+                self.assertEqual(state.cd_track_pos, cd_track_pos)
+                self.assertEqual(state.operation_mode,
+                    operation_mode)
+                self.assertEqual(state.display_mode,
+                    DisplayModes.SHOWING_OPERATION)
 
     def test_cd_scanning(self):
         values = (
             (b"SCANCD1TR04", 1, 4),
             (b"SCANCD3TR15", 3, 15),
         )
+        # set up known values
+        state = self._reset_radio_state(b"CD 5 TR 12 ", b"CD 5  042  ")
+        self.assertEqual(state.operation_mode,
+            OperationModes.CD_PLAYING)
+        self.assertEqual(state.cd_disc, 5)
+        self.assertEqual(state.cd_track, 12)
+        self.assertEqual(state.cd_track_pos, 42)
         for display, disc, track in values:
-            # set up known values
-            self.client.radio_state_reset()
-            self.client.radio_state_parse(b"CD 5 TR 12 ")
-            self.client.radio_state_parse(b"CD 5  042  ")
-            state = self.client.radio_state_dump()
-            self.assertEqual(state.operation_mode,
-                OperationModes.CD_PLAYING)
-            self.assertEqual(state.cd_disc, 5)
-            self.assertEqual(state.cd_track, 12)
-            self.assertEqual(state.cd_track_pos, 42)
-            # parse display
-            self.client.radio_state_parse(display)
-            state = self.client.radio_state_dump()
-            self.assertEqual(state.cd_disc, disc)
-            self.assertEqual(state.cd_track, track)
-            self.assertEqual(state.cd_track_pos, 0)
-            self.assertEqual(state.operation_mode,
-                OperationModes.CD_SCANNING)
-            self.assertEqual(state.display_mode,
-                DisplayModes.SHOWING_OPERATION)
+            with self._subtest(display=display):
+                # parse display from the same known values
+                state = self._reset_radio_state(
+                    b"CD 5 TR 12 ", b"CD 5  042  ", display)
+                self.assertEqual(state.cd_disc, disc)
+                self.assertEqual(state.cd_track, track)
+                self.assertEqual(state.cd_track_pos, 0)
+                self.assertEqual(state.operation_mode,
+                    OperationModes.CD_SCANNING)
+                self.assertEqual(state.display_mode,
+                    DisplayModes.SHOWING_OPERATION)
 
     def test_radio_state_cd_check_magazine(self):
         # set up known values
-        self.client.radio_state_reset()
-        self.client.radio_state_parse(b"CD 1 TR 03 ")
-        self.client.radio_state_parse(b"CD 1  139  ")
-        state = self.client.radio_state_dump()
+        state = self._reset_radio_state(b"CD 1 TR 03 ", b"CD 1  139  ")
         self.assertEqual(state.operation_mode,
             OperationModes.CD_PLAYING)
         self.assertEqual(state.cd_disc, 1)
         self.assertEqual(state.cd_track, 3)
         self.assertEqual(state.cd_track_pos, 99)
         # parse display
-        self.client.radio_state_parse(b"CHK MAGAZIN")
-        state = self.client.radio_state_dump()
+        state = self._parse_radio_state(b"CHK MAGAZIN")
         self.assertEqual(state.cd_disc, 0)
         self.assertEqual(state.cd_track, 0)
         self.assertEqual(state.cd_track_pos, 0)
@@ -1361,18 +1227,14 @@ class TestAvr(BaseTestCase):
 
     def test_radio_state_cd_cdx_no_cd(self):
         # set up known values
-        self.client.radio_state_reset()
-        self.client.radio_state_parse(b"CD 1 TR 03 ")
-        self.client.radio_state_parse(b"CD 1  139  ")
-        state = self.client.radio_state_dump()
+        state = self._reset_radio_state(b"CD 1 TR 03 ", b"CD 1  139  ")
         self.assertEqual(state.operation_mode,
             OperationModes.CD_PLAYING)
         self.assertEqual(state.cd_disc, 1)
         self.assertEqual(state.cd_track, 3)
         self.assertEqual(state.cd_track_pos, 99)
         # parse display
-        self.client.radio_state_parse(b"CD 2 NO CD ") # space in "CD 2"
-        state = self.client.radio_state_dump()
+        state = self._parse_radio_state(b"CD 2 NO CD ") # space in "CD 2"
         self.assertEqual(state.cd_disc, 2)
         self.assertEqual(state.cd_track, 0)
         self.assertEqual(state.cd_track_pos, 0)
@@ -1386,42 +1248,36 @@ class TestAvr(BaseTestCase):
             b"CD1 CD ERR ", # Premium 4
             b"CD 1CD ERR ", # Premium 5
         )
+        # set up known values
+        state = self._reset_radio_state(b"CD 5 TR 03 ", b"CD 5  139  ")
+        self.assertEqual(state.operation_mode,
+            OperationModes.CD_PLAYING)
+        self.assertEqual(state.cd_disc, 5)
+        self.assertEqual(state.cd_track, 3)
+        self.assertEqual(state.cd_track_pos, 99)
         for display in displays:
-            # set up known values
-            self.client.radio_state_reset()
-            self.client.radio_state_parse(b"CD 5 TR 03 ")
-            self.client.radio_state_parse(b"CD 5  139  ")
-            state = self.client.radio_state_dump()
-            self.assertEqual(state.operation_mode,
-                OperationModes.CD_PLAYING)
-            self.assertEqual(state.cd_disc, 5)
-            self.assertEqual(state.cd_track, 3)
-            self.assertEqual(state.cd_track_pos, 99)
-            # parse display
-            self.client.radio_state_parse(display)
-            state = self.client.radio_state_dump()
-            self.assertEqual(state.cd_disc, 1)
-            self.assertEqual(state.cd_track, 0)
-            self.assertEqual(state.cd_track_pos, 0)
-            self.assertEqual(state.operation_mode,
-                OperationModes.CD_CDX_CD_ERR)
-            self.assertEqual(state.display_mode,
-                DisplayModes.SHOWING_OPERATION)
+            with self._subtest(display=display):
+                # parse display from the same known values
+                state = self._reset_radio_state(
+                    b"CD 5 TR 03 ", b"CD 5  139  ", display)
+                self.assertEqual(state.cd_disc, 1)
+                self.assertEqual(state.cd_track, 0)
+                self.assertEqual(state.cd_track_pos, 0)
+                self.assertEqual(state.operation_mode,
+                    OperationModes.CD_CDX_CD_ERR)
+                self.assertEqual(state.display_mode,
+                    DisplayModes.SHOWING_OPERATION)
 
     def test_radio_state_cd_no_disc(self):
         # set up known values
-        self.client.radio_state_reset()
-        self.client.radio_state_parse(b"CD 5 TR 03 ")
-        self.client.radio_state_parse(b"CD 5  139  ")
-        state = self.client.radio_state_dump()
+        state = self._reset_radio_state(b"CD 5 TR 03 ", b"CD 5  139  ")
         self.assertEqual(state.operation_mode,
             OperationModes.CD_PLAYING)
         self.assertEqual(state.cd_disc, 5)
         self.assertEqual(state.cd_track, 3)
         self.assertEqual(state.cd_track_pos, 99)
         # parse display
-        self.client.radio_state_parse(b"    NO DISC")
-        state = self.client.radio_state_dump()
+        state = self._parse_radio_state(b"    NO DISC")
         self.assertEqual(state.cd_disc, 0)
         self.assertEqual(state.cd_track, 0)
         self.assertEqual(state.cd_track_pos, 0)
@@ -1432,18 +1288,14 @@ class TestAvr(BaseTestCase):
 
     def test_radio_state_cd_no_changer(self):
         # set up known values
-        self.client.radio_state_reset()
-        self.client.radio_state_parse(b"CD 5 TR 03 ")
-        self.client.radio_state_parse(b"CD 5  139  ")
-        state = self.client.radio_state_dump()
+        state = self._reset_radio_state(b"CD 5 TR 03 ", b"CD 5  139  ")
         self.assertEqual(state.operation_mode,
             OperationModes.CD_PLAYING)
         self.assertEqual(state.cd_disc, 5)
         self.assertEqual(state.cd_track, 3)
         self.assertEqual(state.cd_track_pos, 99)
         # process
-        self.client.radio_state_parse(b"NO  CHANGER")
-        state = self.client.radio_state_dump()
+        state = self._parse_radio_state(b"NO  CHANGER")
         self.assertEqual(state.cd_disc, 0)
         self.assertEqual(state.cd_track, 0)
         self.assertEqual(state.cd_track_pos, 0)
@@ -1454,13 +1306,10 @@ class TestAvr(BaseTestCase):
 
     def test_radio_state_tape_load_premium_5(self):
         # set up known values
-        self.client.radio_state_reset()
-        self.client.radio_state_parse(b"TAPE PLAY A")
-        state = self.client.radio_state_dump()
+        state = self._reset_radio_state(b"TAPE PLAY A")
         self.assertEqual(state.tape_side, 1)
         # parse display
-        self.client.radio_state_parse(b"TAPE LOAD  ")
-        state = self.client.radio_state_dump()
+        state = self._parse_radio_state(b"TAPE LOAD  ")
         self.assertEqual(state.tape_side, 0)
         self.assertEqual(state.operation_mode,
             OperationModes.TAPE_LOAD)
@@ -1469,15 +1318,12 @@ class TestAvr(BaseTestCase):
 
     def test_radio_state_tape_metal_premium_5(self):
         # set up known values
-        self.client.radio_state_reset()
-        self.client.radio_state_parse(b"TAPE PLAY A")
-        state = self.client.radio_state_dump()
+        state = self._reset_radio_state(b"TAPE PLAY A")
         self.assertEqual(state.tape_side, 1)
         self.assertEqual(state.operation_mode,
             OperationModes.TAPE_PLAYING)
         # parse display
-        self.client.radio_state_parse(b"TAPE METAL ")
-        state = self.client.radio_state_dump()
+        state = self._parse_radio_state(b"TAPE METAL ")
         self.assertEqual(state.tape_side, 1)
         self.assertEqual(state.operation_mode,
             OperationModes.TAPE_METAL)
@@ -1486,15 +1332,12 @@ class TestAvr(BaseTestCase):
 
     def test_tape_bls(self):
         # set up known values
-        self.client.radio_state_reset()
-        self.client.radio_state_parse(b"TAPE PLAY B")
-        state = self.client.radio_state_dump()
+        state = self._reset_radio_state(b"TAPE PLAY B")
         self.assertEqual(state.tape_side, 2)
         self.assertEqual(state.operation_mode,
             OperationModes.TAPE_PLAYING)
         # parse display
-        self.client.radio_state_parse(b"TAPE  BLS  ")
-        state = self.client.radio_state_dump()
+        state = self._parse_radio_state(b"TAPE  BLS  ")
         self.assertEqual(state.tape_side, 2)
         self.assertEqual(state.operation_mode,
             OperationModes.TAPE_BLS)
@@ -1503,16 +1346,12 @@ class TestAvr(BaseTestCase):
 
     def test_radio_state_tape_play_a(self):
         # set up known values
-        self.client.radio_state_reset()
-        self.client.radio_state_parse(b"TAPE PLAY B")
-        self.client.radio_state_parse(b"FM11 915MHZ")
-        state = self.client.radio_state_dump()
+        state = self._reset_radio_state(b"TAPE PLAY B", b"FM11 915MHZ")
         self.assertEqual(state.tape_side, 2)
         self.assertEqual(state.operation_mode,
             OperationModes.TUNER_PLAYING)
         # parse display
-        self.client.radio_state_parse(b"TAPE PLAY A")
-        state = self.client.radio_state_dump()
+        state = self._parse_radio_state(b"TAPE PLAY A")
         self.assertEqual(state.tape_side, 1)
         self.assertEqual(state.operation_mode,
             OperationModes.TAPE_PLAYING)
@@ -1521,16 +1360,12 @@ class TestAvr(BaseTestCase):
 
     def test_radio_state_tape_play_b(self):
         # set up known values
-        self.client.radio_state_reset()
-        self.client.radio_state_parse(b"TAPE PLAY A")
-        self.client.radio_state_parse(b"FM11 915MHZ")
-        state = self.client.radio_state_dump()
+        state = self._reset_radio_state(b"TAPE PLAY A", b"FM11 915MHZ")
         self.assertEqual(state.tape_side, 1)
         self.assertEqual(state.operation_mode,
             OperationModes.TUNER_PLAYING)
         # parse display
-        self.client.radio_state_parse(b"TAPE PLAY B")
-        state = self.client.radio_state_dump()
+        state = self._parse_radio_state(b"TAPE PLAY B")
         self.assertEqual(state.tape_side, 2)
         self.assertEqual(state.operation_mode,
             OperationModes.TAPE_PLAYING)
@@ -1539,16 +1374,12 @@ class TestAvr(BaseTestCase):
 
     def test_radio_state_tape_scan_a(self):
         # set up known values
-        self.client.radio_state_reset()
-        self.client.radio_state_parse(b"TAPE PLAY B")
-        self.client.radio_state_parse(b"FM11 915MHZ")
-        state = self.client.radio_state_dump()
+        state = self._reset_radio_state(b"TAPE PLAY B", b"FM11 915MHZ")
         self.assertEqual(state.tape_side, 2)
         self.assertEqual(state.operation_mode,
             OperationModes.TUNER_PLAYING)
         # parse display
-        self.client.radio_state_parse(b"TAPE SCAN A")
-        state = self.client.radio_state_dump()
+        state = self._parse_radio_state(b"TAPE SCAN A")
         self.assertEqual(state.tape_side, 1)
         self.assertEqual(state.operation_mode,
             OperationModes.TAPE_SCANNING)
@@ -1557,16 +1388,12 @@ class TestAvr(BaseTestCase):
 
     def test_radio_state_tape_scan_b(self):
         # set up known values
-        self.client.radio_state_reset()
-        self.client.radio_state_parse(b"TAPE PLAY A")
-        self.client.radio_state_parse(b"FM11 915MHZ")
-        state = self.client.radio_state_dump()
+        state = self._reset_radio_state(b"TAPE PLAY A", b"FM11 915MHZ")
         self.assertEqual(state.tape_side, 1)
         self.assertEqual(state.operation_mode,
             OperationModes.TUNER_PLAYING)
         # parse display
-        self.client.radio_state_parse(b"TAPE SCAN B")
-        state = self.client.radio_state_dump()
+        state = self._parse_radio_state(b"TAPE SCAN B")
         self.assertEqual(state.tape_side, 2)
         self.assertEqual(state.operation_mode,
             OperationModes.TAPE_SCANNING)
@@ -1575,13 +1402,10 @@ class TestAvr(BaseTestCase):
 
     def test_radio_state_tape_ff(self):
         # set up known values
-        self.client.radio_state_reset()
-        self.client.radio_state_parse(b"TAPE PLAY A")
-        state = self.client.radio_state_dump()
+        state = self._reset_radio_state(b"TAPE PLAY A")
         self.assertEqual(state.tape_side, 1)
         # parse display
-        self.client.radio_state_parse(b"TAPE  FF   ")
-        state = self.client.radio_state_dump()
+        state = self._parse_radio_state(b"TAPE  FF   ")
         self.assertEqual(state.tape_side, 1)
         self.assertEqual(state.operation_mode,
             OperationModes.TAPE_FF)
@@ -1590,13 +1414,10 @@ class TestAvr(BaseTestCase):
 
     def test_radio_state_tape_mss_ff(self):
         # set up known values
-        self.client.radio_state_reset()
-        self.client.radio_state_parse(b"TAPE PLAY B")
-        state = self.client.radio_state_dump()
+        state = self._reset_radio_state(b"TAPE PLAY B")
         self.assertEqual(state.tape_side, 2)
         # parse display
-        self.client.radio_state_parse(b"TAPEMSS FF ")
-        state = self.client.radio_state_dump()
+        state = self._parse_radio_state(b"TAPEMSS FF ")
         self.assertEqual(state.tape_side, 2)
         self.assertEqual(state.operation_mode,
             OperationModes.TAPE_MSS_FF)
@@ -1605,13 +1426,10 @@ class TestAvr(BaseTestCase):
 
     def test_radio_state_tape_rew(self):
         # set up known values
-        self.client.radio_state_reset()
-        self.client.radio_state_parse(b"TAPE PLAY A")
-        state = self.client.radio_state_dump()
+        state = self._reset_radio_state(b"TAPE PLAY A")
         self.assertEqual(state.tape_side, 1)
         # parse display
-        self.client.radio_state_parse(b"TAPE  REW  ")
-        state = self.client.radio_state_dump()
+        state = self._parse_radio_state(b"TAPE  REW  ")
         self.assertEqual(state.tape_side, 1)
         self.assertEqual(state.operation_mode,
             OperationModes.TAPE_REW)
@@ -1620,13 +1438,10 @@ class TestAvr(BaseTestCase):
 
     def test_radio_state_tape_mss_rew(self):
         # set up known values
-        self.client.radio_state_reset()
-        self.client.radio_state_parse(b"TAPE PLAY B")
-        state = self.client.radio_state_dump()
+        state = self._reset_radio_state(b"TAPE PLAY B")
         self.assertEqual(state.tape_side, 2)
         # parse display
-        self.client.radio_state_parse(b"TAPEMSS REW")
-        state = self.client.radio_state_dump()
+        state = self._parse_radio_state(b"TAPEMSS REW")
         self.assertEqual(state.tape_side, 2)
         self.assertEqual(state.operation_mode,
             OperationModes.TAPE_MSS_REW)
@@ -1635,13 +1450,10 @@ class TestAvr(BaseTestCase):
 
     def test_radio_state_tape_error(self):
         # set up known values
-        self.client.radio_state_reset()
-        self.client.radio_state_parse(b"TAPE PLAY A")
-        state = self.client.radio_state_dump()
+        state = self._reset_radio_state(b"TAPE PLAY A")
         self.assertEqual(state.tape_side, 1)
         # parse display
-        self.client.radio_state_parse(b"TAPE ERROR ")
-        state = self.client.radio_state_dump()
+        state = self._parse_radio_state(b"TAPE ERROR ")
         self.assertEqual(state.tape_side, 0)
         self.assertEqual(state.operation_mode,
             OperationModes.TAPE_ERROR)
@@ -1650,13 +1462,10 @@ class TestAvr(BaseTestCase):
 
     def test_radio_state_tape_no_tape(self):
         # set up known values
-        self.client.radio_state_reset()
-        self.client.radio_state_parse(b"TAPE PLAY A")
-        state = self.client.radio_state_dump()
+        state = self._reset_radio_state(b"TAPE PLAY A")
         self.assertEqual(state.tape_side, 1)
         # parse display
-        self.client.radio_state_parse(b"    NO TAPE")
-        state = self.client.radio_state_dump()
+        state = self._parse_radio_state(b"    NO TAPE")
         self.assertEqual(state.tape_side, 0)
         self.assertEqual(state.operation_mode,
             OperationModes.TAPE_NO_TAPE)
@@ -1676,27 +1485,23 @@ class TestAvr(BaseTestCase):
             (b"FM261079MHZ", 1079, TunerBands.FM2, 6),
             )
         for display, freq, band, preset in values:
-            self.client.radio_state_reset()
-            self.client.radio_state_parse(display)
-            state = self.client.radio_state_dump()
-            self.assertEqual(state.tuner_band, band)
-            self.assertEqual(state.tuner_freq, freq)
-            self.assertEqual(state.tuner_preset, preset)
-            self.assertEqual(state.operation_mode,
-                OperationModes.TUNER_PLAYING)
-            self.assertEqual(state.display_mode,
-                DisplayModes.SHOWING_OPERATION)
+            with self._subtest(display=display):
+                state = self._reset_radio_state(display)
+                self.assertEqual(state.tuner_band, band)
+                self.assertEqual(state.tuner_freq, freq)
+                self.assertEqual(state.tuner_preset, preset)
+                self.assertEqual(state.operation_mode,
+                    OperationModes.TUNER_PLAYING)
+                self.assertEqual(state.display_mode,
+                    DisplayModes.SHOWING_OPERATION)
 
     def test_radio_state_tuner_fm_scan_on_fm1_band(self):
         # set up known values
-        self.client.radio_state_reset()
-        self.client.radio_state_parse(b"FM11 915MHZ")
-        state = self.client.radio_state_dump()
+        state = self._reset_radio_state(b"FM11 915MHZ")
         self.assertEqual(state.tuner_band, TunerBands.FM1)
         self.assertEqual(state.tuner_preset, 1)
         # parse display
-        self.client.radio_state_parse(b"SCAN 879MHZ")
-        state = self.client.radio_state_dump()
+        state = self._parse_radio_state(b"SCAN 879MHZ")
         self.assertEqual(state.tuner_freq, 879)
         self.assertEqual(state.tuner_preset, 0)
         self.assertEqual(state.tuner_band, TunerBands.FM1)
@@ -1707,14 +1512,11 @@ class TestAvr(BaseTestCase):
 
     def test_radio_state_tuner_fm_scan_on_fm2_band(self):
         # set up known values
-        self.client.radio_state_reset()
-        self.client.radio_state_parse(b"FM21 915MHZ")
-        state = self.client.radio_state_dump()
+        state = self._reset_radio_state(b"FM21 915MHZ")
         self.assertEqual(state.tuner_band, TunerBands.FM2)
         self.assertEqual(state.tuner_preset, 1)
         # parse display
-        self.client.radio_state_parse(b"SCAN 879MHZ")
-        state = self.client.radio_state_dump()
+        state = self._parse_radio_state(b"SCAN 879MHZ")
         self.assertEqual(state.tuner_freq, 879)
         self.assertEqual(state.tuner_preset, 0)
         self.assertEqual(state.tuner_band, TunerBands.FM2)
@@ -1725,12 +1527,10 @@ class TestAvr(BaseTestCase):
 
     def test_radio_state_tuner_fm_scan_on_unknown_band_sets_fm1(self):
         # set up known values
-        self.client.radio_state_reset()
-        state = self.client.radio_state_dump()
+        state = self._reset_radio_state()
         self.assertEqual(state.tuner_band, TunerBands.UNKNOWN)
         # parse display
-        self.client.radio_state_parse(b"SCAN 879MHZ")
-        state = self.client.radio_state_dump()
+        state = self._parse_radio_state(b"SCAN 879MHZ")
         self.assertEqual(state.tuner_freq, 879)
         self.assertEqual(state.tuner_preset, 0)
         self.assertEqual(state.tuner_band, TunerBands.FM1)
@@ -1748,15 +1548,15 @@ class TestAvr(BaseTestCase):
             (b"AM 61540KHZ", 1540, 6),
             )
         for display, freq, preset in values:
-            self.client.radio_state_reset()
-            self.client.radio_state_parse(display)
-            state = self.client.radio_state_dump()
-            self.assertEqual(state.tuner_freq, freq)
-            self.assertEqual(state.tuner_band, TunerBands.AM)
-            self.assertEqual(state.operation_mode, OperationModes.TUNER_PLAYING)
-            self.assertEqual(state.tuner_preset, preset)
-            self.assertEqual(state.display_mode,
-                DisplayModes.SHOWING_OPERATION)
+            with self._subtest(display=display):
+                state = self._reset_radio_state(display)
+                self.assertEqual(state.tuner_freq, freq)
+                self.assertEqual(state.tuner_band, TunerBands.AM)
+                self.assertEqual(state.operation_mode,
+                    OperationModes.TUNER_PLAYING)
+                self.assertEqual(state.tuner_preset, preset)
+                self.assertEqual(state.display_mode,
+                    DisplayModes.SHOWING_OPERATION)
 
     def test_radio_state_tuner_am_scan_on(self):
         values = (
@@ -1764,34 +1564,31 @@ class TestAvr(BaseTestCase):
             (b"SCAN1710KHZ", 1710),
         )
         for display, freq in values:
-            self.client.radio_state_reset()
-            self.client.radio_state_parse(display)
-            state = self.client.radio_state_dump()
-            self.assertEqual(state.tuner_freq, freq)
-            self.assertEqual(state.tuner_band, TunerBands.AM)
-            self.assertEqual(state.tuner_preset, 0)
-            self.assertEqual(state.operation_mode,
-                OperationModes.TUNER_SCANNING)
-            self.assertEqual(state.display_mode,
-                DisplayModes.SHOWING_OPERATION)
+            with self._subtest(display=display):
+                state = self._reset_radio_state(display)
+                self.assertEqual(state.tuner_freq, freq)
+                self.assertEqual(state.tuner_band, TunerBands.AM)
+                self.assertEqual(state.tuner_preset, 0)
+                self.assertEqual(state.operation_mode,
+                    OperationModes.TUNER_SCANNING)
+                self.assertEqual(state.display_mode,
+                    DisplayModes.SHOWING_OPERATION)
 
     def test_radio_state_ignores_blank(self):
-        self.client.radio_state_reset()
         # set up known values
-        self.client.radio_state_parse(b"FM161079MHZ")
-        state = self.client.radio_state_dump()
+        state = self._reset_radio_state(b"FM161079MHZ")
         self.assertEqual(state.operation_mode,
             OperationModes.TUNER_PLAYING)
         self.assertEqual(state.display_mode,
             DisplayModes.SHOWING_OPERATION)
         # blank displays should not change the state
         for display in (b'\x00'*11, b' '*11):
-            self.client.radio_state_parse(display)
-            state = self.client.radio_state_dump()
-            self.assertEqual(state.operation_mode,
-                OperationModes.TUNER_PLAYING)
-            self.assertEqual(state.display_mode,
-                DisplayModes.SHOWING_OPERATION)
+            with self._subtest(display=display):
+                state = self._parse_radio_state(display)
+                self.assertEqual(state.operation_mode,
+                    OperationModes.TUNER_PLAYING)
+                self.assertEqual(state.display_mode,
+                    DisplayModes.SHOWING_OPERATION)
 
     # Converting uPD16432B key data to key codes
 
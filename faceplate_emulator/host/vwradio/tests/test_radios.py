@@ -3,6 +3,19 @@ from vwradio.radios import Radio
 from vwradio.constants import OperationModes, DisplayModes, TunerBands
 
 class TestRadio(unittest.TestCase):
+    def test_rejects_display_not_11_bytes(self):
+        for display in (b"", b"BASS  - 9", b"FM161079MHZ "):
+            radio = Radio()
+            self.assertRaises(ValueError, radio.parse, display)
+
+    def test_accepts_bytearray_and_text_displays(self):
+        for display in (bytearray(b"FM161079MHZ"), u"FM161079MHZ"):
+            radio = Radio()
+            radio.parse(display)
+            self.assertEqual(radio.tuner_freq, 1079)
+            self.assertEqual(radio.tuner_band, TunerBands.FM1)
+            self.assertEqual(radio.tuner_preset, 6)
+
     def test_safe_mode(self):
         values = (
             # Premium 4
@@ -795,9 +808,36 @@ class TestRadio(unittest.TestCase):
         # set up known values
         radio.operation_mode = OperationModes.TUNER_PLAYING
         radio.display_mode = DisplayModes.SHOWING_OPERATION
-        # parse display
-        radio.parse(b" " * 11)
-        self.assertEqual(radio.operation_mode,
-            OperationModes.TUNER_PLAYING)
+        # blank displays should not change the state
+        for display in (b"\x00" * 11, b" " * 11):
+            radio.parse(display)
+            self.assertEqual(radio.operation_mode,
+                OperationModes.TUNER_PLAYING)
+            self.assertEqual(radio.display_mode,
+                DisplayModes.SHOWING_OPERATION)
+
+    def test_parses_display_again_after_a_different_one(self):
+        radio = Radio()
+        radio.parse(b"FM161079MHZ")
+        radio.parse(b"FM1   MIN  ")
+        self.assertEqual(radio.display_mode,
+            DisplayModes.ADJUSTING_SOUND_VOLUME)
+        radio.parse(b"FM161079MHZ")
         self.assertEqual(radio.display_mode,
             DisplayModes.SHOWING_OPERATION)
+
+    def test_parses_display_again_after_attributes_changed(self):
+        radio = Radio()
+        radio.parse(b"FM161079MHZ")
+        radio.display_mode = DisplayModes.ADJUSTING_SOUND_VOLUME
+        radio.parse(b"FM161079MHZ")
+        self.assertEqual(radio.display_mode,
+            DisplayModes.SHOWING_OPERATION)
+
+    def test_parses_display_again_after_an_unrecognized_one(self):
+        radio = Radio()
+        radio.parse(b"BAL LEFT  1")
+        self.assertRaises(ValueError, radio.parse, b"TAPE PLAY X")
+        radio.parse(b"BAL LEFT  1")
+        self.assertEqual(radio.display_mode,
+            DisplayModes.ADJUSTING_SOUND_BALANCE)